@@ -1,8 +1,12 @@
 """NovaCred post-ingestion data engineering pipeline package."""
 
-from . import clean, config, flatten, io_utils, privacy, quality, schema
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = [
+    "bias",
     "clean",
     "config",
     "flatten",
@@ -11,3 +15,10 @@ __all__ = [
     "quality",
     "schema",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules on first access so `import src.quality` does not load the rest (PEP 562)."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,16 +11,18 @@ inspected, printed, or persisted directly from the notebook.
 
 from __future__ import annotations #Python 3.10+ for cleaner type hints
 
+import warnings
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
 import numpy as np
 import pandas as pd
 import scipy
 from scipy import stats
 
+if TYPE_CHECKING: #matplotlib is imported inside the plot functions so the statistics load without it
+    import matplotlib.pyplot as plt
+
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
@@ -28,6 +30,7 @@ AGE_ORDER = ["<25", "25-34", "35-44", "45-54", "55-64", "65+"] #Ensures bands so
 PALETTE = {"Female": "#E07B8B", "Male": "#4A90D9", "Unknown": "#AAAAAA"}
 FOUR_FIFTHS_THRESHOLD = 0.80
 PRIME_AGE_REFERENCE = "25-34" #Common reference group for age DI comparisons
+MWU_ASYMPTOTIC_MIN_N = 30 #Above this per-group size the normal approximation is used directly
 
 FINANCIAL_COLS = [
     "clean_annual_income",
@@ -39,21 +42,27 @@ FINANCIAL_COLS = [
 
 # ── Data loading ──────────────────────────────────────────────────────────────
 
-def load_analysis(path: Path | str) -> pd.DataFrame:
-    """Load and type-coerce applications_analysis.csv."""
-    df = pd.read_csv(path, dtype={"clean_zip_code": str, "applicant_pseudo_id": str}) #Keep zip codes and IDs as strings to preserve leading zeros
+ANALYSIS_NUMERIC_COLS = [
+    "clean_annual_income", "clean_credit_history_months",
+    "clean_debt_to_income", "clean_savings_balance",
+    "clean_interest_rate", "clean_approved_amount",
+]
+_ANALYSIS_STR_DTYPES = {"clean_zip_code": str, "applicant_pseudo_id": str} #Keep zip codes and IDs as strings to preserve leading zeros
+_ANALYSIS_DTYPES = {**_ANALYSIS_STR_DTYPES, **{col: "float64" for col in ANALYSIS_NUMERIC_COLS}}
+_APPROVED_VALUES = {True: True, False: False, "True": True, "False": False, 1: True, 0: False} #Coerce various representations of boolean values to actual bools, treating unrecognized values as NaN
 
-    df["clean_loan_approved"] = df["clean_loan_approved"].map(
-        {True: True, False: False, "True": True, "False": False, 1: True, 0: False} #Coerce various representations of boolean values to actual bools, treating unrecognized values as NaN
-    )
-    for col in [
-        "clean_annual_income", "clean_credit_history_months",
-        "clean_debt_to_income", "clean_savings_balance",
-        "clean_interest_rate", "clean_approved_amount",
-    ]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce") #Coerce financial columns to numeric, treating non-convertible values as NaN - Data Engineer cleaned data well, this is backup
 
+def load_analysis(path: Path | str) -> pd.DataFrame:
+    """Load and type-coerce applications_analysis.csv."""
+    try:
+        df = pd.read_csv(path, dtype=_ANALYSIS_DTYPES) #Parse financial columns straight to float64 in the C reader
+    except ValueError:
+        df = pd.read_csv(path, dtype=_ANALYSIS_STR_DTYPES)
+        for col in ANALYSIS_NUMERIC_COLS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce") #Dirty values fall back to coercion, treating non-convertible values as NaN
+
+    df["clean_loan_approved"] = df["clean_loan_approved"].map(_APPROVED_VALUES)
     df["approved"] = df["clean_loan_approved"].eq(True).astype("Int64") #Create a standardized 'approved' column as integer (1 for approved, 0 for rejected, <NA> for unknown)
     df["age_band"] = pd.Categorical(df["age_band"], categories=AGE_ORDER, ordered=True) #Ensure age_band is a categorical with the defined order for correct sorting in analyses and plots
     return df
@@ -61,8 +70,10 @@ def load_analysis(path: Path | str) -> pd.DataFrame:
 
 def load_spending(path: Path | str) -> pd.DataFrame:
     """Load spending_items_clean.csv."""
-    df = pd.read_csv(path)
-    if "amount_clean" in df.columns:
+    try:
+        df = pd.read_csv(path, dtype={"amount_clean": "float64"})
+    except ValueError:
+        df = pd.read_csv(path)
         df["amount_clean"] = pd.to_numeric(df["amount_clean"], errors="coerce") #Coerce amount to numeric, treating non-convertible values as NaN - again, backup in case of dirty data
     return df
 
@@ -75,11 +86,22 @@ def approval_rate(df: pd.DataFrame) -> float:
     return float(valid.mean()) if len(valid) > 0 else float("nan") #Return NaN if there are no valid outcomes to avoid misleading 0% approval rate
 
 
+def _stratified_sample(df: pd.DataFrame, group_col: str, num_rows_subsample: int | None, random_state: int) -> pd.DataFrame:
+    """Keep at most num_rows_subsample // n_groups randomly chosen rows per group (no-op when None or already small)."""
+    if num_rows_subsample is None or len(df) <= num_rows_subsample:
+        return df
+    per_group = max(1, num_rows_subsample // max(1, df[group_col].nunique()))
+    shuffled = df.sample(frac=1, random_state=random_state)
+    return shuffled[shuffled.groupby(group_col, observed=True).cumcount() < per_group] #Rows beyond the per-group quota are dropped
+
+
 def disparate_impact(
     df: pd.DataFrame,
     group_col: str,
     privileged: str,
     unprivileged: str,
+    num_rows_subsample: int | None = None,
+    random_state: int = 0,
 ) -> dict[str, Any]:
     """
     Compute the Disparate Impact Ratio and related fairness metrics.
@@ -88,7 +110,13 @@ def disparate_impact(
 
     The four-fifths (80 %) rule flags DI < 0.80 as potential disparate impact.
     Returns a dict with rates, DI, DPD, and the four-fifths flag.
+
+    With num_rows_subsample set, each group is stratified-subsampled first;
+    rates are unchanged in expectation, and privileged_n / unprivileged_n
+    then report the subsampled group sizes the rates were computed on.
     """
+    if num_rows_subsample is not None:
+        df = _stratified_sample(df[df[group_col].isin([privileged, unprivileged])], group_col, num_rows_subsample, random_state)
     priv_df = df[df[group_col] == privileged]
     unpriv_df = df[df[group_col] == unprivileged]
 
@@ -110,79 +138,133 @@ def disparate_impact(
     }
 
 
-def chi2_test(df: pd.DataFrame, group_col: str, outcome_col: str = "approved") -> dict[str, Any]:
-    """Chi-squared test of independence between a group column and loan approval."""
-    valid = df[[group_col, outcome_col]].dropna()
-    ct = pd.crosstab(valid[group_col], valid[outcome_col]) #Builds contingency table
+def chi2_test(df: pd.DataFrame, group_col: str, outcome_col: str = "approved",
+              num_rows_subsample: int | None = None, random_state: int = 0) -> dict[str, Any]:
+    """
+    Chi-squared test of independence between a group column and loan approval.
+
+    num_rows_subsample caps the rows tested via a stratified per-group sample.
+    """
+    valid = _stratified_sample(df[[group_col, outcome_col]].dropna(), group_col, num_rows_subsample, random_state)
+    g_codes, g_levels = pd.factorize(valid[group_col]) #Integer codes for observed levels only
+    o_codes, o_levels = pd.factorize(valid[outcome_col])
+    ct = np.zeros((len(g_levels), len(o_levels)), dtype=np.int64)
+    np.add.at(ct, (g_codes, o_codes), 1) #Builds contingency table in one pass; level order does not affect the test
     chi2, p, dof, _ = stats.chi2_contingency(ct)
     return {"chi2": round(chi2, 4), "p_value": round(p, 6), "dof": dof, "significant_at_05": bool(p < 0.05)}
 # The chi-squared test checks if there's a statistically significant association between the grouping variable (e.g., gender or age band) and the approval outcome.
 
-def mannwhitney_test(a: pd.Series, b: pd.Series) -> dict[str, Any]: #Mann-Whitney chosen for lack of assumptions about distribution and robustness to outliers, suitable for financial features which may be skewed
-    """Two-sided Mann-Whitney U test between two numeric series."""
+def mannwhitney_test(a: pd.Series, b: pd.Series, num_rows_subsample: int | None = None, random_state: int = 0) -> dict[str, Any]: #Mann-Whitney chosen for lack of assumptions about distribution and robustness to outliers, suitable for financial features which may be skewed
+    """
+    Two-sided Mann-Whitney U test between two numeric series.
+
+    num_rows_subsample caps the total sample, split evenly between a and b.
+    """
     a, b = a.dropna(), b.dropna()
+    if num_rows_subsample is not None:
+        per_side = max(1, num_rows_subsample // 2)
+        a = a.sample(n=per_side, random_state=random_state) if len(a) > per_side else a
+        b = b.sample(n=per_side, random_state=random_state) if len(b) > per_side else b
+    return _mannwhitney_clean(a, b)
+
+
+def _mannwhitney_clean(a: pd.Series | np.ndarray, b: pd.Series | np.ndarray, presorted: bool = False) -> dict[str, Any]:
+    """Mann-Whitney U test for inputs the caller has already stripped of nulls (and optionally sorted)."""
     if len(a) < 2 or len(b) < 2:
         return {"u_stat": float("nan"), "p_value": float("nan"), "significant_at_05": False}
-    u, p = stats.mannwhitneyu(a, b, alternative="two-sided") #Checks for any difference, rather than assuming which group we expect to be higher
+    if len(a) > MWU_ASYMPTOTIC_MIN_N and len(b) > MWU_ASYMPTOTIC_MIN_N:
+        a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+        u, p = _mwu_asymptotic(a, b) if presorted else _mwu_asymptotic(np.sort(a), np.sort(b))
+    else:
+        u, p = stats.mannwhitneyu(a, b, alternative="two-sided") #Checks for any difference, rather than assuming which group we expect to be higher
     return {"u_stat": round(u, 1), "p_value": round(p, 6), "significant_at_05": bool(p < 0.05)}
 
 
+def _mwu_asymptotic(a: np.ndarray, b: np.ndarray) -> tuple[float, float]:
+    """
+    Two-sided Mann-Whitney U with the tie-corrected normal approximation.
+
+    Both inputs must already be sorted ascending. Mirrors SciPy's asymptotic
+    method (continuity correction included), which SciPy itself selects for
+    samples of this size, but skips its input validation and re-ranking.
+    """
+    n1, n2 = a.size, b.size
+    n = n1 + n2
+
+    # U1 counts, for every value in a, the values in b below it plus half of those tied with it
+    below = np.searchsorted(b, a, side="left")
+    tied = np.searchsorted(b, a, side="right") - below
+    u1 = float(below.sum() + 0.5 * tied.sum())
+
+    # Tie-group sizes of the pooled sample; a stable sort merges the two sorted runs in linear time
+    pooled = np.sort(np.concatenate([a, b]), kind="stable")
+    starts = np.r_[True, pooled[1:] != pooled[:-1]]
+    ties = np.diff(np.r_[np.flatnonzero(starts), n])
+
+    u = max(u1, n1 * n2 - u1)
+    sd = np.sqrt(n1 * n2 / 12 * ((n + 1) - (ties**3 - ties).sum() / (n * (n - 1))))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (u - n1 * n2 / 2 - 0.5) / sd #All-tied samples give sd == 0 and z = -inf, i.e. p = 1 as in SciPy
+    return float(u1), float(np.clip(2 * stats.norm.sf(z), 0, 1))
+
+
 # ── Prepared subsets ──────────────────────────────────────────────────────────
 
+def _gender_known_mask(df: pd.DataFrame) -> pd.Series:
+    """Known binary gender and a non-null outcome."""
+    return df["clean_gender"].isin(["Male", "Female"]) & df["approved"].notna()
+
+
+def _age_known_mask(df: pd.DataFrame) -> pd.Series:
+    """Known age band and a non-null outcome."""
+    return df["age_band"].notna() & df["approved"].notna()
+
+
 def gender_subset(df: pd.DataFrame) -> pd.DataFrame:
-    """Rows with a known binary gender and a non-null outcome."""
-    return df[
-        df["clean_gender"].isin(["Male", "Female"]) & df["approved"].notna()
-    ].copy()
+    """
+    Rows with a known binary gender and a non-null outcome.
+
+    The result is a filtered frame without a defensive copy; take an
+    explicit ``.copy()`` before assigning to it.
+    """
+    return df[_gender_known_mask(df)]
 
 
 def age_subset(df: pd.DataFrame) -> pd.DataFrame:
-    """Rows with a known age band and a non-null outcome."""
-    return df[df["age_band"].notna() & df["approved"].notna()].copy()
+    """Rows with a known age band and a non-null outcome (filtered, not copied)."""
+    return df[_age_known_mask(df)]
 
 
 # ── Approval rate tables ──────────────────────────────────────────────────────
 
-def gender_approval_table(df: pd.DataFrame) -> pd.DataFrame:
-    """Approval counts and rate by gender."""
-    gdf = gender_subset(df)
-    tbl = (
-        gdf.groupby("clean_gender", observed=True)["approved"]
+def _rate_table(df: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Approval counts and rate per group, aggregated in a single groupby pass."""
+    return (
+        df[keys + ["approved"]] #Project to the grouping keys first so the groupby never touches unused columns
+        .groupby(keys, observed=True, sort=False)["approved"]
         .agg(n="count", approved_n="sum")
         .assign(approval_rate=lambda x: x["approved_n"] / x["n"])
         .reset_index()
-        .rename(columns={"clean_gender": "gender"})
+        .sort_values(keys, ignore_index=True) #Order only the aggregated rows; categorical keys sort by AGE_ORDER
     )
+
+
+def gender_approval_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Approval counts and rate by gender."""
+    tbl = _rate_table(gender_subset(df), ["clean_gender"]).rename(columns={"clean_gender": "gender"})
     return tbl
 
 
 def age_approval_table(df: pd.DataFrame) -> pd.DataFrame:
     """Approval counts and rate by age band (ordered)."""
-    adf = age_subset(df)
-    tbl = (
-        adf.groupby("age_band", observed=True)["approved"]
-        .agg(n="count", approved_n="sum")
-        .assign(approval_rate=lambda x: x["approved_n"] / x["n"])
-        .reset_index()
-        .sort_values("age_band")
-    )
+    tbl = _rate_table(age_subset(df), ["age_band"])
     return tbl
 
 
 def interaction_table(df: pd.DataFrame) -> pd.DataFrame:
     """Approval rate by age band × gender."""
-    sub = df[
-        df["clean_gender"].isin(["Male", "Female"]) &
-        df["age_band"].notna() &
-        df["approved"].notna()
-    ].copy()
-    tbl = (
-        sub.groupby(["age_band", "clean_gender"], observed=True)["approved"]
-        .agg(n="count", approved_n="sum")
-        .assign(approval_rate=lambda x: x["approved_n"] / x["n"])
-        .reset_index()
-        .sort_values(["age_band", "clean_gender"])
-    )
+    sub = df[_gender_known_mask(df) & df["age_band"].notna()]
+    tbl = _rate_table(sub, ["age_band", "clean_gender"])
     return tbl
 
 
@@ -191,13 +273,25 @@ def interaction_table(df: pd.DataFrame) -> pd.DataFrame:
 def age_di_table(df: pd.DataFrame, reference: str = PRIME_AGE_REFERENCE) -> pd.DataFrame:
     """DI ratios for every age band vs a reference band."""
     adf = age_subset(df)
-    rows = []
-    for band in AGE_ORDER:
-        if band == reference or band not in adf["age_band"].values:
-            continue
-        r = disparate_impact(adf, "age_band", privileged=reference, unprivileged=band)
-        rows.append(r)
-    return pd.DataFrame(rows)
+    g = adf.groupby("age_band", observed=True, sort=False)["approved"].agg(n="count", approved_n="sum") #One pass over the subset for every band
+    g["rate"] = (g["approved_n"] / g["n"]).astype(float)
+
+    ref_n = int(g.loc[reference, "n"]) if reference in g.index else 0
+    ref_rate = float(g.loc[reference, "rate"]) if reference in g.index else float("nan")
+    bands = g.loc[[band for band in AGE_ORDER if band != reference and band in g.index]]
+
+    di = bands["rate"] / ref_rate if ref_rate > 0 else pd.Series(float("nan"), index=bands.index)
+    return pd.DataFrame({
+        "privileged_group": reference,
+        "unprivileged_group": bands.index.astype(str),
+        "privileged_n": ref_n,
+        "unprivileged_n": bands["n"].to_numpy(),
+        "privileged_rate": ref_rate,
+        "unprivileged_rate": bands["rate"].to_numpy(),
+        "disparate_impact": di.to_numpy(),
+        "demographic_parity_difference": (bands["rate"] - ref_rate).to_numpy(),
+        "four_fifths_flag": (di < FOUR_FIFTHS_THRESHOLD).to_numpy(), #NaN DI compares False, matching disparate_impact
+    })
 
 
 # ── Proxy discrimination ──────────────────────────────────────────────────────
@@ -208,22 +302,35 @@ def financial_proxy_table(df: pd.DataFrame) -> pd.DataFrame:
     Returns one row per feature with medians and significance.
     """
     gdf = gender_subset(df)
-    rows = []
-    for col in FINANCIAL_COLS:
-        if col not in gdf.columns:
-            continue
-        males = gdf.loc[gdf["clean_gender"] == "Male", col]
-        females = gdf.loc[gdf["clean_gender"] == "Female", col]
-        result = mannwhitney_test(males, females)
-        rows.append({
-            "feature": col,
-            "male_median": round(males.dropna().median(), 4),
-            "female_median": round(females.dropna().median(), 4),
-            "u_stat": result["u_stat"],
-            "p_value": result["p_value"],
-            "significant_at_05": result["significant_at_05"],
-        })
-    return pd.DataFrame(rows)
+    cols = [col for col in FINANCIAL_COLS if col in gdf.columns]
+    if not cols:
+        return pd.DataFrame()
+
+    # One (features x applicants) matrix per gender so all tests run in a single vectorised call
+    male_mat = gdf.loc[gdf["clean_gender"] == "Male", cols].to_numpy(dtype=float).T
+    female_mat = gdf.loc[gdf["clean_gender"] == "Female", cols].to_numpy(dtype=float).T
+    testable = (np.sum(~np.isnan(male_mat), axis=1) >= 2) & (np.sum(~np.isnan(female_mat), axis=1) >= 2) #Same minimum sample rule as mannwhitney_test
+
+    u = np.full(len(cols), np.nan)
+    p = np.full(len(cols), np.nan)
+    if testable.any():
+        u[testable], p[testable] = stats.mannwhitneyu(
+            male_mat[testable], female_mat[testable], alternative="two-sided", axis=1, nan_policy="omit"
+        )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning) #A feature with no values for one gender has a NaN median, as before
+        male_median = np.nanmedian(male_mat, axis=1) if male_mat.shape[1] else np.full(len(cols), np.nan)
+        female_median = np.nanmedian(female_mat, axis=1) if female_mat.shape[1] else np.full(len(cols), np.nan)
+
+    return pd.DataFrame({
+        "feature": cols,
+        "male_median": np.round(male_median, 4), #Row medians straight off the matrices, skipping the pandas reduction dispatch
+        "female_median": np.round(female_median, 4),
+        "u_stat": np.round(u, 1),
+        "p_value": np.round(p, 6),
+        "significant_at_05": p < 0.05,
+    })
 # This table helps identify if there are significant differences in financial features between men and women which may lead to proxy discrimination if those features are used in the model.
 # Regardless of gender being considered directly in lending decisions.
 
@@ -237,8 +344,13 @@ def spending_gender_table(analysis_df: pd.DataFrame, spending_df: pd.DataFrame)
     if cat_col is None or amt_col is None:
         return None
 
-    gender_ids = gender_subset(analysis_df)[["application_id", "clean_gender"]]
-    merged = spending_df.merge(gender_ids, on="application_id", how="inner")
+    gender_ids = gender_subset(analysis_df)
+    id2g = dict(zip(gender_ids["application_id"].to_numpy(), gender_ids["clean_gender"].to_numpy())) #Applications are far fewer than spending rows, so a dict lookup beats a hash join
+    merged = (
+        spending_df[[cat_col, amt_col]]
+        .assign(clean_gender=spending_df["application_id"].map(id2g))
+        .dropna(subset=["clean_gender"])
+    )
     if merged.empty:
         return None
 
@@ -253,11 +365,12 @@ def spending_gender_table(analysis_df: pd.DataFrame, spending_df: pd.DataFrame)
 
 def credit_age_correlation(df: pd.DataFrame) -> dict[str, Any]:
     """Spearman correlation between age-band rank and credit history months."""
-    adf = age_subset(df).copy()
-    age_map = {b: i for i, b in enumerate(AGE_ORDER)}
-    adf["age_band_rank"] = adf["age_band"].map(age_map)
-    valid = adf[["age_band_rank", "clean_credit_history_months"]].dropna()
-    rho, p = stats.spearmanr(valid["age_band_rank"], valid["clean_credit_history_months"])
+    adf = age_subset(df)
+    rank = pd.Categorical(adf["age_band"], categories=AGE_ORDER).codes.astype(float) #Category codes follow AGE_ORDER, so they are the band rank
+    rank[rank < 0] = np.nan
+    credit = adf["clean_credit_history_months"].to_numpy(dtype=float)
+    valid = ~np.isnan(rank) & ~np.isnan(credit)
+    rho, p = stats.spearmanr(rank[valid], credit[valid])
     return {"spearman_rho": round(rho, 4), "p_value": round(p, 6), "significant_at_05": bool(p < 0.05)}
 # This correlation can indicate if age is acting as a proxy for credit history length, which may be a factor in lending decisions and could lead to indirect discrimination against younger applicants if credit history is heavily weighted.
 
@@ -268,38 +381,50 @@ def interest_rate_by_gender(df: pd.DataFrame) -> dict[str, Any]:
     Compare interest rates for approved Male vs Female applicants.
     Returns descriptive stats and a Mann-Whitney test.
     """
-    approved = gender_subset(df)[df["approved"].eq(1)].copy() if "approved" in df.columns else pd.DataFrame()
-    if approved.empty or "clean_interest_rate" not in approved.columns:
+    if "approved" not in df.columns or "clean_interest_rate" not in df.columns:
+        return {}
+    mask = _gender_known_mask(df) & df["approved"].eq(1) #One combined mask over the same index instead of chaining two differently-indexed filters
+    approved = df.loc[mask, ["clean_gender", "clean_interest_rate"]]
+    if approved.empty:
         return {}
 
     males = approved.loc[approved["clean_gender"] == "Male", "clean_interest_rate"]
     females = approved.loc[approved["clean_gender"] == "Female", "clean_interest_rate"]
-    test = mannwhitney_test(males, females)
+    # Drop nulls and sort once per group; median, mean and the U test all reuse the sorted arrays
+    males = np.sort(males.dropna().to_numpy(dtype=float))
+    females = np.sort(females.dropna().to_numpy(dtype=float))
+    test = _mannwhitney_clean(males, females, presorted=True)
 
     return {
-        "male_n": int(males.dropna().count()),
-        "female_n": int(females.dropna().count()),
-        "male_median_rate": round(males.dropna().median(), 6),
-        "female_median_rate": round(females.dropna().median(), 6),
-        "male_mean_rate": round(males.dropna().mean(), 6),
-        "female_mean_rate": round(females.dropna().mean(), 6),
+        "male_n": int(males.size),
+        "female_n": int(females.size),
+        "male_median_rate": round(_sorted_median(males), 6),
+        "female_median_rate": round(_sorted_median(females), 6),
+        "male_mean_rate": round(males.mean(), 6) if males.size else float("nan"),
+        "female_mean_rate": round(females.mean(), 6) if females.size else float("nan"),
         **test,
     }
 
 
+def _sorted_median(values: np.ndarray) -> float:
+    """Median of an ascending-sorted array without re-sorting it."""
+    if values.size == 0:
+        return float("nan")
+    mid = values.size // 2
+    return float(values[mid]) if values.size % 2 else float((values[mid - 1] + values[mid]) / 2)
+
+
 # ── Rejection reason breakdown ────────────────────────────────────────────────
 
 def rejection_reason_by_gender(df: pd.DataFrame) -> pd.DataFrame | None:
     """Count of each rejection reason split by gender for rejected applicants."""
     gdf = gender_subset(df)
     rejected = gdf[gdf["approved"] == 0]
-    if "clean_rejection_reason" not in rejected.columns or rejected.empty:
+    if "clean_rejection_reason" not in rejected.columns or rejected["clean_rejection_reason"].isna().all():
         return None
     tbl = (
-        rejected.groupby(["clean_rejection_reason", "clean_gender"], observed=True)
-        .size()
-        .unstack(fill_value=0)
-        .assign(total=lambda x: x.sum(axis=1))
+        pd.crosstab(rejected["clean_rejection_reason"], rejected["clean_gender"], margins=True, margins_name="total") #Counts and row totals in one call
+        .drop(index="total")
         .sort_values("total", ascending=False)
     )
     return tbl
@@ -366,9 +491,15 @@ def _save(fig: plt.Figure, path: Path | None) -> None:
 
 
 def plot_gender_di(gender_tbl: pd.DataFrame, di_result: dict[str, Any],
-                   save_path: Path | None = None) -> plt.Figure:
-    """Side-by-side: approval rate bars + DI gauge."""
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+                   save_path: Path | None = None,
+                   axes: tuple[plt.Axes, plt.Axes] | None = None) -> plt.Figure:
+    """Side-by-side: approval rate bars + DI gauge (optionally drawn onto two existing axes)."""
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as mticker
+    if axes is None:
+        fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    else:
+        fig = axes[0].figure
 
     # Left — approval rate bars
     ax = axes[0]
@@ -406,18 +537,21 @@ def plot_gender_di(gender_tbl: pd.DataFrame, di_result: dict[str, Any],
     flag_color = "#E74C3C" if di_val < FOUR_FIFTHS_THRESHOLD else "#27AE60"
     fig.suptitle(flag_text, fontsize=12, color=flag_color, fontweight="bold", y=0.02)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _save(fig, save_path)
     return fig
 
 
-def plot_age_approval(age_tbl: pd.DataFrame, save_path: Path | None = None) -> plt.Figure:
+def plot_age_approval(age_tbl: pd.DataFrame, save_path: Path | None = None,
+                      ax: plt.Axes | None = None) -> plt.Figure:
     """Approval rate by age band with reference and four-fifths threshold lines."""
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as mticker
     tbl = age_tbl.copy().sort_values("age_band")
     ref_rate = float(tbl.loc[tbl["age_band"] == PRIME_AGE_REFERENCE, "approval_rate"].iloc[0]) if PRIME_AGE_REFERENCE in tbl["age_band"].values else float("nan")
 
-    fig, ax = plt.subplots(figsize=(11, 5))
-    bands = tbl["age_band"].astype(str).tolist()
+    fig, ax = plt.subplots(figsize=(11, 5)) if ax is None else (ax.figure, ax)
+    bands = tbl["age_band"].tolist()
     rates = tbl["approval_rate"].tolist()
     ns = tbl["n"].tolist()
 
@@ -442,24 +576,37 @@ def plot_age_approval(age_tbl: pd.DataFrame, save_path: Path | None = None) -> p
     ax.legend(fontsize=9)
     ax.spines[["top", "right"]].set_visible(False)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _save(fig, save_path)
     return fig
 
 
-def plot_interaction_heatmap(interaction_tbl: pd.DataFrame, save_path: Path | None = None) -> plt.Figure:
-    """Heatmap of approval rate by gender × age band."""
-    heat = interaction_tbl.pivot(index="age_band", columns="clean_gender", values="approval_rate")
-    heat = heat.reindex(AGE_ORDER)
+def interaction_pivots(interaction_tbl: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Approval-rate and count pivots (age band × gender) from interaction_table.
+
+    Both are reindexed to AGE_ORDER. Compute once and pass to the interaction
+    plots via ``pivots=`` so each plot only renders.
+    """
+    rate_pivot = interaction_tbl.pivot(index="age_band", columns="clean_gender", values="approval_rate").reindex(AGE_ORDER)
     n_pivot = interaction_tbl.pivot(index="age_band", columns="clean_gender", values="n").reindex(AGE_ORDER)
+    return rate_pivot, n_pivot
 
-    fig, ax = plt.subplots(figsize=(7, 5))
+
+def plot_interaction_heatmap(interaction_tbl: pd.DataFrame, save_path: Path | None = None,
+                             ax: plt.Axes | None = None,
+                             pivots: tuple[pd.DataFrame, pd.DataFrame] | None = None) -> plt.Figure:
+    """Heatmap of approval rate by gender × age band."""
+    import matplotlib.pyplot as plt
+    heat, n_pivot = pivots if pivots is not None else interaction_pivots(interaction_tbl)
+
+    fig, ax = plt.subplots(figsize=(7, 5)) if ax is None else (ax.figure, ax)
     im = ax.imshow(heat.values.astype(float), cmap="RdYlGn", aspect="auto", vmin=0, vmax=1)
 
     ax.set_xticks(range(len(heat.columns)))
     ax.set_xticklabels(heat.columns.tolist(), fontsize=12)
     ax.set_yticks(range(len(heat.index)))
-    ax.set_yticklabels(heat.index.astype(str).tolist(), fontsize=11)
+    ax.set_yticklabels(heat.index.tolist(), fontsize=11) #Index already holds the AGE_ORDER labels from the reindex
 
     for i in range(heat.shape[0]):
         for j in range(heat.shape[1]):
@@ -471,27 +618,31 @@ def plot_interaction_heatmap(interaction_tbl: pd.DataFrame, save_path: Path | No
                 ax.text(j, i, f"{float(val):.1%}{n_str}",
                         ha="center", va="center", fontsize=10, color=text_color)
 
-    plt.colorbar(im, ax=ax, label="Approval Rate", format="{x:.0%}")
+    fig.colorbar(im, ax=ax, label="Approval Rate", format="{x:.0%}")
     ax.set_title("Approval Rate: Gender × Age Band", fontsize=13, fontweight="bold")
     ax.set_xlabel("Gender", fontsize=11)
     ax.set_ylabel("Age Band", fontsize=11)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _save(fig, save_path)
     return fig
 
 
-def plot_interaction_bars(interaction_tbl: pd.DataFrame, save_path: Path | None = None) -> plt.Figure:
+def plot_interaction_bars(interaction_tbl: pd.DataFrame, save_path: Path | None = None,
+                          ax: plt.Axes | None = None,
+                          pivots: tuple[pd.DataFrame, pd.DataFrame] | None = None) -> plt.Figure:
     """Grouped bars: approval rate by age band, split by gender."""
-    fig, ax = plt.subplots(figsize=(12, 5))
-    bands = [b for b in AGE_ORDER if b in interaction_tbl["age_band"].astype(str).values]
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as mticker
+    rate_pivot, _ = pivots if pivots is not None else interaction_pivots(interaction_tbl)
+    rate_pivot = rate_pivot.reindex(columns=["Female", "Male"]).dropna(how="all") #Skip bands with no applicants of either gender
+    fig, ax = plt.subplots(figsize=(12, 5)) if ax is None else (ax.figure, ax)
+    bands = rate_pivot.index.tolist()
     x = np.arange(len(bands))
     width = 0.35
 
     for i, g in enumerate(["Female", "Male"]):
-        g_data = (interaction_tbl[interaction_tbl["clean_gender"] == g]
-                  .set_index("age_band")["approval_rate"])
-        vals = [float(g_data.get(b, float("nan"))) for b in bands]
+        vals = rate_pivot[g].to_numpy(dtype=float)
         rects = ax.bar(x + (i - 0.5) * width, vals, width,
                        label=g, color=PALETTE[g], edgecolor="white", alpha=0.9)
         for rect, v in zip(rects, vals):
@@ -509,13 +660,15 @@ def plot_interaction_bars(interaction_tbl: pd.DataFrame, save_path: Path | None
     ax.legend(title="Gender", fontsize=10)
     ax.spines[["top", "right"]].set_visible(False)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _save(fig, save_path)
     return fig
 
 
-def plot_financial_boxplots(df: pd.DataFrame, save_path: Path | None = None) -> plt.Figure:
+def plot_financial_boxplots(df: pd.DataFrame, save_path: Path | None = None,
+                            axes: list[plt.Axes] | None = None) -> plt.Figure:
     """Box plots of key financial features by gender (proxy discrimination check)."""
+    import matplotlib.pyplot as plt
     gdf = gender_subset(df)
     plot_feats = [
         ("clean_annual_income",         "Annual Income ($)"),
@@ -524,9 +677,12 @@ def plot_financial_boxplots(df: pd.DataFrame, save_path: Path | None = None) ->
     ]
     plot_feats = [(c, l) for c, l in plot_feats if c in gdf.columns]
 
-    fig, axes = plt.subplots(1, len(plot_feats), figsize=(5 * len(plot_feats), 5))
-    if len(plot_feats) == 1:
-        axes = [axes]
+    if axes is None:
+        fig, axes = plt.subplots(1, len(plot_feats), figsize=(5 * len(plot_feats), 5))
+        if len(plot_feats) == 1:
+            axes = [axes]
+    else:
+        fig = axes[0].figure
 
     for ax, (col, label) in zip(axes, plot_feats):
         groups = [gdf.loc[gdf["clean_gender"] == g, col].dropna().values
@@ -542,18 +698,21 @@ def plot_financial_boxplots(df: pd.DataFrame, save_path: Path | None = None) ->
 
     fig.suptitle("Financial Feature Distribution by Gender (Proxy Check)",
                  fontsize=12, fontweight="bold")
-    plt.tight_layout()
+    fig.tight_layout()
     _save(fig, save_path)
     return fig
 
 
-def plot_interest_rate(df: pd.DataFrame, save_path: Path | None = None) -> plt.Figure:
+def plot_interest_rate(df: pd.DataFrame, save_path: Path | None = None,
+                       ax: plt.Axes | None = None) -> plt.Figure:
     """Overlapping histograms of interest rates for approved applicants by gender."""
-    approved = gender_subset(df)[gender_subset(df)["approved"].eq(1)]
+    import matplotlib.pyplot as plt
+    gdf = gender_subset(df)
+    approved = gdf[gdf["approved"].eq(1)]
     if "clean_interest_rate" not in approved.columns:
-        fig, ax = plt.subplots(); ax.set_title("No interest rate data"); return fig
+        fig, ax = plt.subplots() if ax is None else (ax.figure, ax); ax.set_title("No interest rate data"); return fig
 
-    fig, ax = plt.subplots(figsize=(9, 5))
+    fig, ax = plt.subplots(figsize=(9, 5)) if ax is None else (ax.figure, ax)
     for g, color in [("Female", PALETTE["Female"]), ("Male", PALETTE["Male"])]:
         vals = approved.loc[approved["clean_gender"] == g, "clean_interest_rate"].dropna()
         if len(vals) > 0:
@@ -568,6 +727,6 @@ def plot_interest_rate(df: pd.DataFrame, save_path: Path | None = None) -> plt.F
     ax.legend(fontsize=10)
     ax.spines[["top", "right"]].set_visible(False)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _save(fig, save_path)
     return fig
@@ -1,19 +1,48 @@
 from __future__ import annotations
 
-import re
-from datetime import date
-from typing import Any
+from importlib.util import find_spec
 
 import numpy as np
 import pandas as pd
 
 from . import config
 
+_BOOL_MAP = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    "yes": True,
+    "no": False,
+    "y": True,
+    "n": False,
+}
+_BOOL_KEYS = pd.CategoricalDtype(list(_BOOL_MAP))
+_BOOL_VALUES = np.array(list(_BOOL_MAP.values()), dtype=bool)
+_GENDER_KEYS = pd.CategoricalDtype(list(config.GENDER_MAP))
+_GENDER_VALUES = np.array(list(config.GENDER_MAP.values()), dtype=object)
+_STANDARDISED_GENDER_CODES = [_GENDER_KEYS.categories.get_loc(key) for key in ("m", "f")]
+# Arrow-backed strings run the .str kernels over contiguous UTF-8 buffers; fall back to
+# pandas' Python-backed strings when pyarrow is not installed
+_SLASH_DATE_PATTERN = r"^(\d{2})/(\d{2})/(\d{4})$"
+_STRING_DTYPE = pd.StringDtype("pyarrow" if find_spec("pyarrow") is not None else "python")
+
+
+def _strip_str(series: pd.Series) -> pd.Series:
+    """Convert to pandas strings and trim whitespace once; missing values stay <NA>."""
+    return series.astype(_STRING_DTYPE).str.strip()
+
+
+def _blank_mask_stripped(stripped: pd.Series) -> pd.Series:
+    """Return a boolean mask for null or empty values of an already stripped Series."""
+    return stripped.fillna("").eq("").astype(bool)
+
 
 def _blank_mask(series: pd.Series) -> pd.Series:
     """Return a boolean mask for null or blank string-like values."""
-    as_obj = series.astype("object")
-    return as_obj.isna() | as_obj.astype(str).str.strip().eq("")
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+        return series.isna()
+    return _blank_mask_stripped(_strip_str(series))
 
 
 def _to_numeric(series: pd.Series) -> pd.Series:
@@ -21,142 +50,201 @@ def _to_numeric(series: pd.Series) -> pd.Series:
     return pd.to_numeric(series, errors="coerce")
 
 
+def _nullify_out_of_range(
+    series: pd.Series, lower: float = -np.inf, upper: float = np.inf
+) -> tuple[pd.Series, pd.Series]:
+    """Coerce to float, null values outside [lower, upper], and return (clean values, nullified flag)."""
+    values = _to_numeric(series).to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        flag = (values < lower) | (values > upper)
+    clean = np.where(flag, np.nan, values)
+    return pd.Series(clean, index=series.index), pd.Series(flag, index=series.index)
+
+
+def _to_int_nullable(series: pd.Series) -> pd.Series:
+    """Cast float values to nullable Int64, rounding only when some value has a fractional part."""
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        integral = bool(np.all(np.isnan(values) | (np.mod(values, 1) == 0)))
+    return series.astype("Int64") if integral else series.round().astype("Int64")
+
+
 def _to_bool(series: pd.Series) -> pd.Series:
-    """Coerce mixed truthy and falsey values into a nullable boolean-like Series."""
-    mapping = {
-        "true": True,
-        "false": False,
-        "1": True,
-        "0": False,
-        "yes": True,
-        "no": False,
-        "y": True,
-        "n": False,
-    }
-    out: list[Any] = []
-    for value in series:
-        if isinstance(value, bool):
-            out.append(value)
-        elif value is None or (isinstance(value, float) and np.isnan(value)):
-            out.append(np.nan)
-        else:
-            out.append(mapping.get(str(value).strip().lower(), np.nan))
-    return pd.Series(out, index=series.index, dtype="object")
-
-
-def _parse_dob_value(value: Any) -> tuple[pd.Timestamp | pd.NaT, bool, bool]:
-    """Return parsed DOB, ambiguity flag, and parse-failed flag for one source value."""
-    if value is None:
-        return pd.NaT, False, False
-    value_str = str(value).strip()
-    if value_str == "":
-        return pd.NaT, False, False
-
-    for fmt in ("%Y-%m-%d", "%Y/%m/%d"):
-        try:
-            parsed = pd.to_datetime(value_str, format=fmt, errors="raise")
-            return pd.Timestamp(parsed), False, False
-        except ValueError:
-            continue
-
-    if re.match(r"^\d{2}/\d{2}/\d{4}$", value_str):
-        left, right, year_str = value_str.split("/")
-        left_num = int(left)
-        right_num = int(right)
-        year_num = int(year_str)
-        ambiguous = left_num <= 12 and right_num <= 12
-        if left_num > 12:
-            day, month = left_num, right_num
-        else:
-            month, day = left_num, right_num
-        try:
-            parsed_date = date(year_num, month, day)
-            return pd.Timestamp(parsed_date), ambiguous, False
-        except ValueError:
-            return pd.NaT, False, True
-
-    return pd.NaT, False, True
+    """Coerce mixed truthy and falsey values into a nullable boolean Series."""
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype("boolean")
+    codes = _strip_str(series).str.lower().astype(_BOOL_KEYS).cat.codes.to_numpy()
+    return pd.Series(pd.arrays.BooleanArray(_BOOL_VALUES[codes], codes < 0), index=series.index)
+
+
+def _format_datetimes(values: pd.Series, unit: str, suffix: str = "") -> pd.Series:
+    """Format datetimes as ISO text truncated to unit in one vectorised pass; NaT becomes NaN."""
+    if values.dt.tz is not None:
+        values = values.dt.tz_localize(None)
+    text = np.char.add(np.datetime_as_string(values.to_numpy(dtype=f"datetime64[{unit}]"), unit=unit), suffix)
+    return pd.Series(text, index=values.index, dtype="object").where(values.notna(), np.nan)
+
+
+def _parse_dob_series(values: pd.Series) -> pd.DataFrame:
+    """Return parsed DOB, ambiguity flag, and parse-failed flag for a whole source column."""
+    stripped = _strip_str(values)
+    blank = _blank_mask_stripped(stripped)
+
+    dash_dates = pd.to_datetime(stripped, format="%Y-%m-%d", errors="coerce")
+    dash_ok = dash_dates.notna()
+    slash_iso_dates = pd.to_datetime(stripped.where(~dash_ok), format="%Y/%m/%d", errors="coerce")
+    slash_iso_ok = slash_iso_dates.notna()
+
+    parts = stripped.where(~(dash_ok | slash_iso_ok | blank)).str.extract(_SLASH_DATE_PATTERN).astype("Int64")
+    parts = parts[parts[2].notna()]
+    left, right = parts[0], parts[1]
+    day_first = left > 12
+    nn_dates = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    if not parts.empty:
+        nn_dates.loc[parts.index] = pd.to_datetime(
+            pd.DataFrame({
+                "year": parts[2],
+                "month": right.where(day_first, left),
+                "day": left.where(day_first, right),
+            }),
+            errors="coerce",
+        )
+    ambiguous = ((left <= 12) & (right <= 12)).reindex(values.index, fill_value=False).astype(bool) & nn_dates.notna()
+
+    parsed = pd.Series(
+        np.select([dash_ok, slash_iso_ok], [dash_dates, slash_iso_dates], default=nn_dates.to_numpy()),
+        index=values.index,
+    )
+
+    return pd.DataFrame(
+        {
+            "clean_date_of_birth": _format_datetimes(parsed, unit="D").where(parsed.notna(), pd.NA),
+            "dob_ambiguous_flag": ambiguous,
+            "dob_parse_failed_flag": parsed.isna() & ~blank,
+        },
+        index=values.index,
+    )
+
+
+def _normalise_stripped(stripped: pd.Series, lower: bool = False) -> pd.Series:
+    """Optionally lowercase an already stripped Series and convert blanks to missing values."""
+    cleaned = stripped.str.lower() if lower else stripped
+    return cleaned.astype("object").mask(_blank_mask_stripped(cleaned), pd.NA)
 
 
 def _normalise_text(series: pd.Series, lower: bool = False) -> pd.Series:
     """Trim whitespace, optionally lowercase, and convert blanks to missing values."""
-    cleaned = series.fillna("").astype(str).str.strip()
-    if lower:
-        cleaned = cleaned.str.lower()
-    return cleaned.mask(cleaned.eq(""), pd.NA)
+    return _normalise_stripped(_strip_str(series), lower=lower)
 
 
-def clean_applications(applications_df: pd.DataFrame) -> pd.DataFrame:
-    """Apply deterministic cleaning and keep only audit-relevant remediation flags."""
-    out = applications_df.copy().sort_values("application_row_id").reset_index(drop=True)
+def _applicant_columns(out: pd.DataFrame) -> dict[str, pd.Series | np.ndarray]:
+    """Clean email and standardise gender."""
+    gender_codes = _strip_str(out["raw_applicant_gender"]).str.lower().astype(_GENDER_KEYS).cat.codes.to_numpy()
+    return {
+        "clean_email": _normalise_text(out["raw_applicant_email"], lower=True),
+        "clean_gender": np.where(gender_codes >= 0, _GENDER_VALUES[gender_codes], np.nan),
+        "gender_standardized_flag": np.isin(gender_codes, _STANDARDISED_GENDER_CODES),
+    }
 
-    out["clean_email"] = _normalise_text(out["raw_applicant_email"], lower=True)
 
-    gender_key = out["raw_applicant_gender"].fillna("").astype(str).str.strip().str.lower()
-    out["clean_gender"] = gender_key.map(config.GENDER_MAP)
-    out["gender_standardized_flag"] = gender_key.isin({"m", "f"})
+def _date_columns(out: pd.DataFrame) -> dict[str, pd.Series | np.ndarray]:
+    """Parse the date of birth and normalise the processing timestamp to UTC."""
+    new_cols: dict[str, pd.Series | np.ndarray] = dict(_parse_dob_series(out["raw_applicant_date_of_birth"]).items())
+    parsed_ts = pd.to_datetime(out["raw_processing_timestamp"], errors="coerce", utc=True)
+    new_cols["clean_processing_timestamp"] = _format_datetimes(parsed_ts, unit="s", suffix="Z")
+    return new_cols
 
-    parsed_dob = out["raw_applicant_date_of_birth"].apply(_parse_dob_value)
-    out["clean_date_of_birth"] = parsed_dob.apply(
-        lambda item: item[0].strftime("%Y-%m-%d") if pd.notna(item[0]) else pd.NA
-    )
-    out["dob_ambiguous_flag"] = parsed_dob.apply(lambda item: bool(item[1]))
-    out["dob_parse_failed_flag"] = parsed_dob.apply(lambda item: bool(item[2]))
 
-    parsed_ts = pd.to_datetime(out["raw_processing_timestamp"], errors="coerce", utc=True)
-    out["clean_processing_timestamp"] = parsed_ts.dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+def _location_columns(out: pd.DataFrame) -> dict[str, pd.Series | np.ndarray]:
+    """Trim the zip code."""
+    return {"clean_zip_code": _normalise_text(out["raw_applicant_zip_code"], lower=False)}
 
-    out["clean_zip_code"] = _normalise_text(out["raw_applicant_zip_code"], lower=False)
 
+def _financial_columns(out: pd.DataFrame) -> dict[str, pd.Series | np.ndarray]:
+    """Resolve annual income and null out-of-range financial values."""
+    new_cols: dict[str, pd.Series | np.ndarray] = {}
     income_raw = out["raw_financial_annual_income"]
     salary_raw = out["raw_financial_annual_salary"]
     income_missing = _blank_mask(income_raw)
     salary_missing = _blank_mask(salary_raw)
-    income_selected = income_raw.where(~income_missing, salary_raw)
-    out["annual_income_from_salary_flag"] = income_missing & (~salary_missing)
-    out["clean_annual_income"] = _to_numeric(income_selected)
-
-    credit_history_num = _to_numeric(out["raw_financial_credit_history_months"])
-    out["credit_history_nullified_flag"] = credit_history_num < 0
-    out["clean_credit_history_months"] = credit_history_num.mask(
-        out["credit_history_nullified_flag"]
-    ).round().astype("Int64")
-
-    dti_num = _to_numeric(out["raw_financial_debt_to_income"])
-    out["dti_nullified_flag"] = (dti_num < 0) | (dti_num > 1)
-    out["clean_debt_to_income"] = dti_num.mask(out["dti_nullified_flag"])
-
-    savings_num = _to_numeric(out["raw_financial_savings_balance"])
-    out["savings_nullified_flag"] = savings_num < 0
-    out["clean_savings_balance"] = savings_num.mask(out["savings_nullified_flag"])
-
-    out["clean_loan_approved"] = _to_bool(out["raw_decision_loan_approved"])
-    out["clean_interest_rate"] = _to_numeric(out["raw_decision_interest_rate"])
-    out["clean_approved_amount"] = _to_numeric(out["raw_decision_approved_amount"])
-    out["clean_rejection_reason"] = _normalise_text(out["raw_decision_rejection_reason"])
-
-    approved_mask = out["clean_loan_approved"].eq(True)
-    rejected_mask = out["clean_loan_approved"].eq(False)
-    out["approved_missing_terms_flag"] = approved_mask & (
-        out["clean_interest_rate"].isna() | out["clean_approved_amount"].isna()
+    new_cols["annual_income_from_salary_flag"] = income_missing & (~salary_missing)
+    new_cols["clean_annual_income"] = _to_numeric(income_raw).where(~income_missing, _to_numeric(salary_raw))
+
+    credit_history_clean, new_cols["credit_history_nullified_flag"] = _nullify_out_of_range(
+        out["raw_financial_credit_history_months"], lower=0
     )
-    out["rejected_missing_reason_flag"] = rejected_mask & out["clean_rejection_reason"].isna()
+    new_cols["clean_credit_history_months"] = _to_int_nullable(credit_history_clean)
 
-    return out
+    dti_clean, new_cols["dti_nullified_flag"] = _nullify_out_of_range(
+        out["raw_financial_debt_to_income"], lower=0, upper=1
+    )
+    new_cols["clean_debt_to_income"] = dti_clean
 
+    savings_clean, new_cols["savings_nullified_flag"] = _nullify_out_of_range(
+        out["raw_financial_savings_balance"], lower=0
+    )
+    new_cols["clean_savings_balance"] = savings_clean
+    return new_cols
+
+
+def _decision_columns(out: pd.DataFrame) -> dict[str, pd.Series | np.ndarray]:
+    """Coerce the loan decision fields and flag incomplete approvals and rejections."""
+    loan_approved = _to_bool(out["raw_decision_loan_approved"])
+    interest_rate = _to_numeric(out["raw_decision_interest_rate"])
+    approved_amount = _to_numeric(out["raw_decision_approved_amount"])
+    rejection_reason = _normalise_text(out["raw_decision_rejection_reason"])
+    approved_mask = loan_approved.eq(True).fillna(False).to_numpy(dtype=bool)
+    rejected_mask = loan_approved.eq(False).fillna(False).to_numpy(dtype=bool)
+    return {
+        "clean_loan_approved": loan_approved,
+        "clean_interest_rate": interest_rate,
+        "clean_approved_amount": approved_amount,
+        "clean_rejection_reason": rejection_reason,
+        "approved_missing_terms_flag": approved_mask & (interest_rate.isna() | approved_amount.isna()),
+        "rejected_missing_reason_flag": rejected_mask & rejection_reason.isna(),
+    }
 
-def clean_spending_items(spending_df: pd.DataFrame) -> pd.DataFrame:
-    """Clean spending rows and keep only the minimal flag set needed downstream."""
-    out = spending_df.copy().sort_values(["application_row_id", "spending_index"]).reset_index(drop=True)
 
-    category_clean = out["raw_category"].fillna("").astype(str).str.strip()
-    out["category_clean"] = category_clean.str.lower().str.title().mask(category_clean.eq(""), pd.NA)
-    out["category_missing_flag"] = category_clean.eq("")
+_APPLICATION_COLUMN_BLOCKS = (
+    _applicant_columns,
+    _date_columns,
+    _location_columns,
+    _financial_columns,
+    _decision_columns,
+)
 
-    amount_blank = _blank_mask(out["raw_amount"])
-    amount_num = _to_numeric(out["raw_amount"])
-    out["amount_invalid_flag"] = (~amount_blank) & amount_num.isna()
-    out["amount_negative_flag"] = amount_num < 0
-    out["amount_clean"] = amount_num.mask(out["amount_negative_flag"])
+
+def clean_applications(applications_df: pd.DataFrame) -> pd.DataFrame:
+    """Apply deterministic cleaning and keep only audit-relevant remediation flags."""
+    out = applications_df
+    if not out["application_row_id"].is_monotonic_increasing:
+        out = out.sort_values("application_row_id", kind="mergesort")
+    out = out.reset_index(drop=True)
+
+    new_cols: dict[str, pd.Series | np.ndarray] = {}
+    for block in _APPLICATION_COLUMN_BLOCKS:
+        new_cols.update(block(out))
+    return pd.concat([out, pd.DataFrame(new_cols, index=out.index)], axis=1)
+
+
+def clean_spending_items(spending_df: pd.DataFrame) -> pd.DataFrame:
+    """Clean spending rows and keep only the minimal flag set needed downstream."""
+    sort_keys = ["application_row_id", "spending_index"]
+    out = spending_df
+    if not pd.MultiIndex.from_frame(out[sort_keys]).is_monotonic_increasing:
+        out = out.sort_values(sort_keys, kind="mergesort")
+    out = out.reset_index(drop=True)
+
+    category_clean = _strip_str(out["raw_category"])
+    category_missing = _blank_mask_stripped(category_clean)
+    out["category_clean"] = category_clean.str.title().astype("object").mask(category_missing, pd.NA)
+    out["category_missing_flag"] = category_missing
+
+    amount_raw = out["raw_amount"]
+    amount_num = _to_numeric(amount_raw)
+    amount_negative = amount_num < 0
+    out["amount_invalid_flag"] = (~_blank_mask(amount_raw)) & amount_num.isna()
+    out["amount_negative_flag"] = amount_negative
+    out["amount_clean"] = amount_num.mask(amount_negative)
 
     return out
@@ -28,73 +28,101 @@ def _optional_top_level_fields(records: Iterable[dict[str, Any]]) -> list[str]:
     return sorted(fields - KNOWN_TOP_LEVEL_FIELDS)
 
 
+APPLICATION_COLUMNS = [
+    "application_row_id",
+    "application_id",
+    "raw_processing_timestamp",
+    "raw_applicant_full_name",
+    "raw_applicant_email",
+    "raw_applicant_ssn",
+    "raw_applicant_ip_address",
+    "raw_applicant_gender",
+    "raw_applicant_date_of_birth",
+    "raw_applicant_zip_code",
+    "raw_financial_annual_income",
+    "raw_financial_annual_salary",
+    "raw_financial_credit_history_months",
+    "raw_financial_debt_to_income",
+    "raw_financial_savings_balance",
+    "raw_decision_loan_approved",
+    "raw_decision_interest_rate",
+    "raw_decision_approved_amount",
+    "raw_decision_rejection_reason",
+]
+
+SPENDING_COLUMNS = [
+    "application_row_id",
+    "application_id",
+    "spending_index",
+    "raw_category",
+    "raw_amount",
+]
+
+
+def _flatten_columns(
+    records: list[dict[str, Any]], *, applications: bool = True, spending: bool = True
+) -> tuple[dict[str, list[Any]], dict[str, list[Any]]]:
+    """Build application and/or spending column lists in a single pass over the raw records."""
+    optional_fields = _optional_top_level_fields(records) if applications else []
+    app = {column: [] for column in [*APPLICATION_COLUMNS, *(f"raw_{field}" for field in optional_fields)]}
+    spend = {column: [] for column in SPENDING_COLUMNS}
+    for row_id, record in enumerate(records):
+        application_id = record.get("_id")
+
+        if applications:
+            applicant = _safe_dict(record.get("applicant_info"))
+            financials = _safe_dict(record.get("financials"))
+            decision = _safe_dict(record.get("decision"))
+
+            app["application_row_id"].append(row_id)
+            app["application_id"].append(application_id)
+            app["raw_processing_timestamp"].append(record.get("processing_timestamp"))
+            app["raw_applicant_full_name"].append(applicant.get("full_name"))
+            app["raw_applicant_email"].append(applicant.get("email"))
+            app["raw_applicant_ssn"].append(applicant.get("ssn"))
+            app["raw_applicant_ip_address"].append(applicant.get("ip_address"))
+            app["raw_applicant_gender"].append(applicant.get("gender"))
+            app["raw_applicant_date_of_birth"].append(applicant.get("date_of_birth"))
+            app["raw_applicant_zip_code"].append(applicant.get("zip_code"))
+            app["raw_financial_annual_income"].append(financials.get("annual_income"))
+            app["raw_financial_annual_salary"].append(financials.get("annual_salary"))
+            app["raw_financial_credit_history_months"].append(financials.get("credit_history_months"))
+            app["raw_financial_debt_to_income"].append(financials.get("debt_to_income"))
+            app["raw_financial_savings_balance"].append(financials.get("savings_balance"))
+            app["raw_decision_loan_approved"].append(decision.get("loan_approved"))
+            app["raw_decision_interest_rate"].append(decision.get("interest_rate"))
+            app["raw_decision_approved_amount"].append(decision.get("approved_amount"))
+            app["raw_decision_rejection_reason"].append(decision.get("rejection_reason"))
+            for field in optional_fields:
+                app[f"raw_{field}"].append(record.get(field))
+
+        if spending:
+            spending_items = record.get("spending_behavior")
+            if not isinstance(spending_items, list):
+                continue
+            for idx, item in enumerate(spending_items):
+                spending_item = _safe_dict(item)
+                spend["application_row_id"].append(row_id)
+                spend["application_id"].append(application_id)
+                spend["spending_index"].append(idx)
+                spend["raw_category"].append(spending_item.get("category"))
+                spend["raw_amount"].append(spending_item.get("amount"))
+    return app, spend
+
+
 def flatten_applications(records: list[dict[str, Any]]) -> pd.DataFrame:
     """Flatten raw records into one application row per source JSON entry."""
-    optional_fields = _optional_top_level_fields(records)
-    rows: list[dict[str, Any]] = []
-    for row_id, record in enumerate(records):
-        applicant = _safe_dict(record.get("applicant_info"))
-        financials = _safe_dict(record.get("financials"))
-        decision = _safe_dict(record.get("decision"))
-
-        row: dict[str, Any] = {
-            "application_row_id": row_id,
-            "application_id": record.get("_id"),
-            "raw_processing_timestamp": record.get("processing_timestamp"),
-            "raw_applicant_full_name": applicant.get("full_name"),
-            "raw_applicant_email": applicant.get("email"),
-            "raw_applicant_ssn": applicant.get("ssn"),
-            "raw_applicant_ip_address": applicant.get("ip_address"),
-            "raw_applicant_gender": applicant.get("gender"),
-            "raw_applicant_date_of_birth": applicant.get("date_of_birth"),
-            "raw_applicant_zip_code": applicant.get("zip_code"),
-            "raw_financial_annual_income": financials.get("annual_income"),
-            "raw_financial_annual_salary": financials.get("annual_salary"),
-            "raw_financial_credit_history_months": financials.get("credit_history_months"),
-            "raw_financial_debt_to_income": financials.get("debt_to_income"),
-            "raw_financial_savings_balance": financials.get("savings_balance"),
-            "raw_decision_loan_approved": decision.get("loan_approved"),
-            "raw_decision_interest_rate": decision.get("interest_rate"),
-            "raw_decision_approved_amount": decision.get("approved_amount"),
-            "raw_decision_rejection_reason": decision.get("rejection_reason"),
-        }
-        for field in optional_fields:
-            row[f"raw_{field}"] = record.get(field)
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
-    return df.sort_values("application_row_id").reset_index(drop=True)
+    application_columns, _ = _flatten_columns(records, spending=False)
+    return pd.DataFrame(application_columns)
 
 
 def flatten_spending_items(records: list[dict[str, Any]]) -> pd.DataFrame:
     """Explode spending_behavior into one row per spending item."""
-    rows: list[dict[str, Any]] = []
-    for row_id, record in enumerate(records):
-        application_id = record.get("_id")
-        spending_items = record.get("spending_behavior")
-        if not isinstance(spending_items, list):
-            continue
-        for idx, item in enumerate(spending_items):
-            spending = _safe_dict(item)
-            rows.append(
-                {
-                    "application_row_id": row_id,
-                    "application_id": application_id,
-                    "spending_index": idx,
-                    "raw_category": spending.get("category"),
-                    "raw_amount": spending.get("amount"),
-                }
-            )
-    df = pd.DataFrame(
-        rows,
-        columns=[
-            "application_row_id",
-            "application_id",
-            "spending_index",
-            "raw_category",
-            "raw_amount",
-        ],
-    )
-    if df.empty:
-        return df
-    return df.sort_values(["application_row_id", "spending_index"]).reset_index(drop=True)
+    _, spending_columns = _flatten_columns(records, applications=False)
+    return pd.DataFrame(spending_columns)
+
+
+def flatten_records(records: list[dict[str, Any]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Flatten applications and spending items together in one pass over the records."""
+    application_columns, spending_columns = _flatten_columns(records)
+    return pd.DataFrame(application_columns), pd.DataFrame(spending_columns)
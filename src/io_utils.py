@@ -8,6 +8,11 @@ import pandas as pd
 
 from . import config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def ensure_output_dirs() -> None:
     """Create curated/quality directories if needed."""
@@ -18,7 +23,10 @@ def ensure_output_dirs() -> None:
 def load_raw_json(path: Path | str = config.RAW_JSON_PATH) -> list[dict[str, Any]]:
     """Load raw JSON and enforce top-level list semantics."""
     path = Path(path)
-    records = json.loads(path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        records = orjson.loads(path.read_bytes())
+    else:
+        records = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(records, list):
         raise ValueError(f"Expected top-level list in {path}, got: {type(records).__name__}")
     return records
@@ -1,98 +1,166 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Callable
+from functools import partial, wraps
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
 from . import config
+from .clean import _STRING_DTYPE
 
 
-def _mask_text(value: Any, replacement: str = "[REDACTED]") -> Any:
+def _is_blank(value: Any) -> bool:
+    """Return True for null (None/NaN/NA/NaT) or empty-string values."""
+    if isinstance(value, str):
+        return not value.strip()
+    return pd.isna(value) is True
+
+
+def _nonblank_str(mask: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a masker so blanks pass through and it only ever sees stripped text."""
+
+    @wraps(mask)
+    def wrapper(value: Any, *args: Any, **kwargs: Any) -> Any:
+        if _is_blank(value):
+            return value
+        return mask(str(value).strip(), *args, **kwargs)
+
+    return wrapper
+
+
+@_nonblank_str
+def _mask_text(value: str, replacement: str = "[REDACTED]") -> str:
     """Mask non-blank scalar text values with a fixed replacement token."""
-    if value is None or (isinstance(value, float) and np.isnan(value)):
-        return value
-    value_str = str(value).strip()
-    if value_str == "":
-        return value
     return replacement
 
 
-def _mask_email(value: Any) -> Any:
+@_nonblank_str
+def _mask_email(value: str) -> str:
     """Mask emails while keeping a minimal domain-level preview."""
-    if value is None or (isinstance(value, float) and np.isnan(value)):
-        return value
-    value_str = str(value).strip()
-    if value_str == "":
-        return value
-    if "@" not in value_str:
+    if "@" not in value:
         return "[REDACTED_EMAIL]"
-    local, domain = value_str.split("@", 1)
+    local, domain = value.split("@", 1)
     local_masked = local[:1] + "***" if local else "***"
     return f"{local_masked}@{domain}"
 
 
-def _mask_ssn(value: Any) -> Any:
+@_nonblank_str
+def _mask_ssn(value: str) -> str:
     """Mask SSN-like values except for the last four characters."""
-    if value is None or (isinstance(value, float) and np.isnan(value)):
-        return value
-    value_str = str(value).strip()
-    if value_str == "":
-        return value
-    return "***-**-" + value_str[-4:]
+    return "***-**-" + value[-4:]
 
 
-def _mask_ip(value: Any) -> Any:
+@_nonblank_str
+def _mask_ip(value: str) -> str:
     """Mask IP address values with a fixed token."""
-    if value is None or (isinstance(value, float) and np.isnan(value)):
-        return value
-    value_str = str(value).strip()
-    if value_str == "":
-        return value
     return "[REDACTED_IP]"
 
 
-def _mask_dob(value: Any) -> Any:
+@_nonblank_str
+def _mask_dob(value: str) -> str:
     """Mask date-of-birth values while preserving only the year prefix."""
-    if value is None or (isinstance(value, float) and np.isnan(value)):
-        return value
-    value_str = str(value).strip()
-    if value_str == "":
-        return value
-    year = value_str[:4] if len(value_str) >= 4 else "XXXX"
+    year = value[:4] if len(value) >= 4 else "XXXX"
     return f"{year}-**-**"
 
 
-def _redact_by_key(key: str, value: Any) -> Any:
-    """Apply key-based redaction rules to scalar values."""
-    key_lower = key.lower()
+def _identity(value: Any) -> Any:
+    """Return the value unchanged for keys that carry no direct identifiers."""
+    return value
+
+
+def _redactor_for_key(key_lower: str) -> Callable[[Any], Any]:
+    """Pick the masking function that applies to a lower-cased record key."""
     if "ssn" in key_lower:
-        return _mask_ssn(value)
+        return _mask_ssn
     if "email" in key_lower:
-        return _mask_email(value)
+        return _mask_email
     if "ip" in key_lower:
-        return _mask_ip(value)
+        return _mask_ip
     if "full_name" in key_lower or key_lower.endswith("name"):
-        return _mask_text(value, "[REDACTED_NAME]")
+        return partial(_mask_text, replacement="[REDACTED_NAME]")
     if "date_of_birth" in key_lower:
-        return _mask_dob(value)
-    return value
+        return _mask_dob
+    return _identity
+
+
+_REDACTOR_CACHE: dict[str, Callable[[Any], Any]] = {}
+
+
+def _redact_by_key(key: str, value: Any) -> Any:
+    """Apply key-based redaction rules to scalar values."""
+    redactor = _REDACTOR_CACHE.get(key)
+    if redactor is None:
+        redactor = _REDACTOR_CACHE[key] = _redactor_for_key(key.lower())
+    return redactor(value)
+
+
+_NODE_KINDS: dict[type, str] = {dict: "dict", list: "list", str: "scalar", int: "scalar", float: "scalar", bool: "scalar", type(None): "scalar"}
+
+
+def _node_kind(value: Any) -> str:
+    """Classify a value of an unseen type (e.g. a dict subclass) and remember the answer."""
+    kind = "dict" if isinstance(value, dict) else "list" if isinstance(value, list) else "scalar"
+    _NODE_KINDS[type(value)] = kind
+    return kind
 
 
 def redact_record(record: dict[str, Any]) -> dict[str, Any]:
     """Redact PII values in a nested record for safe printing and logging."""
     redacted: dict[str, Any] = {}
-    for key, value in record.items():
-        if isinstance(value, dict):
-            redacted[key] = redact_record(value)
-        elif isinstance(value, list):
-            redacted[key] = [redact_record(item) if isinstance(item, dict) else item for item in value]
-        else:
-            redacted[key] = _redact_by_key(key, value)
+    stack = [(record, redacted)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            kind = _NODE_KINDS.get(type(value)) or _node_kind(value)
+            if kind == "dict":
+                target[key] = nested = {}
+                stack.append((value, nested))
+            elif kind == "list":
+                items = []
+                for item in value:
+                    if (_NODE_KINDS.get(type(item)) or _node_kind(item)) == "dict":
+                        nested = {}
+                        stack.append((item, nested))
+                        items.append(nested)
+                    else:
+                        items.append(item)
+                target[key] = items
+            else:
+                target[key] = _redact_by_key(key, value)
     return redacted
 
 
+def _mask_nonblank(series: pd.Series, masked: Any, blank: pd.Series | None = None) -> pd.Series:
+    """Swap in masked values for non-blank entries, leaving null/empty values untouched."""
+    return series.where(_blank_mask(series) if blank is None else blank, masked)
+
+
+def _mask_ssn_series(series: pd.Series) -> pd.Series:
+    """Vectorised _mask_ssn."""
+    stripped, blank = _stripped_text(series)
+    return _mask_nonblank(series, "***-**-" + stripped.str[-4:], blank)
+
+
+def _mask_email_series(series: pd.Series) -> pd.Series:
+    """Vectorised _mask_email."""
+    stripped, blank = _stripped_text(series)
+    parts = stripped.str.split("@", n=1)
+    local, domain = parts.str[0], parts.str[1]
+    local_masked = np.where(local.ne(""), local.str[:1] + "***", "***")
+    masked = np.where(stripped.str.contains("@", regex=False), local_masked + "@" + domain, "[REDACTED_EMAIL]")
+    return _mask_nonblank(series, masked, blank)
+
+
+def _mask_dob_series(series: pd.Series) -> pd.Series:
+    """Vectorised _mask_dob."""
+    stripped, blank = _stripped_text(series)
+    year = stripped.str[:4].where(stripped.str.len().ge(4), "XXXX")
+    return _mask_nonblank(series, year + "-**-**", blank)
+
+
 def safe_preview_df(df: pd.DataFrame, pii_columns: list[str], n: int = 5) -> pd.DataFrame:
     """Return a redacted dataframe preview without exposing direct identifiers."""
     preview = df.head(n).copy()
@@ -100,130 +168,182 @@ def safe_preview_df(df: pd.DataFrame, pii_columns: list[str], n: int = 5) -> pd.
         if column not in preview.columns:
             continue
         if "ssn" in column:
-            preview[column] = preview[column].apply(_mask_ssn)
+            preview[column] = _mask_ssn_series(preview[column])
         elif "email" in column:
-            preview[column] = preview[column].apply(_mask_email)
+            preview[column] = _mask_email_series(preview[column])
         elif "ip" in column:
-            preview[column] = preview[column].apply(_mask_ip)
+            preview[column] = _mask_nonblank(preview[column], "[REDACTED_IP]")
         elif "date_of_birth" in column:
-            preview[column] = preview[column].apply(_mask_dob)
+            preview[column] = _mask_dob_series(preview[column])
         elif "full_name" in column:
-            preview[column] = preview[column].apply(lambda value: _mask_text(value, "[REDACTED_NAME]"))
+            preview[column] = _mask_nonblank(preview[column], "[REDACTED_NAME]")
     return preview
 
 
-def _is_blank(value: Any) -> bool:
-    """Return True for null or empty-string values."""
-    if value is None:
-        return True
-    if isinstance(value, float) and np.isnan(value):
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    return False
-
-
 def _stable_hash(seed: str, salt: str) -> str:
     """Create a deterministic SHA-256 hash from a salt and seed."""
     return hashlib.sha256(f"{salt}|{seed}".encode("utf-8")).hexdigest()
 
 
+def _stable_hashes(seeds: pd.Series, salt: str) -> list[str]:
+    """Batch form of _stable_hash: prefix and encode in pandas, then hash each payload."""
+    sha256 = hashlib.sha256
+    payloads = (f"{salt}|" + seeds).str.encode("utf-8").to_numpy()
+    return [sha256(payload).hexdigest() for payload in payloads]
+
+
+def _stripped_text(series: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Return str(value).strip() per element alongside the matching _is_blank mask."""
+    stripped = series.astype(str).astype(_STRING_DTYPE).str.strip()
+    return stripped, series.isna() | stripped.eq("").to_numpy(dtype=bool)
+
+
+def _blank_mask(series: pd.Series) -> pd.Series:
+    """Vectorised counterpart of _is_blank for an object column."""
+    return _stripped_text(series)[1]
+
+
+_PSEUDO_ID_SOURCES = np.array(["ssn", "email_fallback", "name_dob_zip_fallback", "application_id_fallback"], dtype=object)
+
+
 def assign_applicant_pseudo_id(df: pd.DataFrame, salt: str = config.HASH_SALT) -> tuple[pd.Series, pd.Series]:
     """Generate deterministic applicant pseudonyms and capture the source strategy used."""
-    pseudo_ids: list[str] = []
-    pseudo_sources: list[str] = []
-    for _, row in df.iterrows():
-        ssn = row.get("raw_applicant_ssn")
-        email = row.get("raw_applicant_email")
-        full_name = row.get("raw_applicant_full_name")
-        dob = row.get("raw_applicant_date_of_birth")
-        zip_code = row.get("raw_applicant_zip_code")
-        application_id = row.get("application_id")
-        application_row_id = row.get("application_row_id")
-
-        if not _is_blank(ssn):
-            seed = f"ssn:{str(ssn).strip()}"
-            source = "ssn"
-        elif not _is_blank(email):
-            seed = f"email:{str(email).strip().lower()}"
-            source = "email_fallback"
-        elif not (_is_blank(full_name) and _is_blank(dob) and _is_blank(zip_code)):
-            seed = f"name_dob_zip:{str(full_name).strip().lower()}|{str(dob).strip()}|{str(zip_code).strip()}"
-            source = "name_dob_zip_fallback"
-        else:
-            seed = f"application:{application_id}|row:{application_row_id}"
-            source = "application_id_fallback"
-
-        pseudo_ids.append(_stable_hash(seed, salt=salt))
-        pseudo_sources.append(source)
-
-    return pd.Series(pseudo_ids, index=df.index), pd.Series(pseudo_sources, index=df.index)
+    missing = pd.Series([None] * len(df), index=df.index, dtype=object)
+    ssn = df.get("raw_applicant_ssn", missing)
+    email = df.get("raw_applicant_email", missing)
+    full_name = df.get("raw_applicant_full_name", missing)
+    dob = df.get("raw_applicant_date_of_birth", missing)
+    zip_code = df.get("raw_applicant_zip_code", missing)
+    application_id = df.get("application_id", missing)
+    application_row_id = df.get("application_row_id", missing)
+
+    ssn_text, ssn_blank = _stripped_text(ssn)
+    email_text, email_blank = _stripped_text(email)
+    name_text, name_blank = _stripped_text(full_name)
+    dob_text, dob_blank = _stripped_text(dob)
+    zip_text, zip_blank = _stripped_text(zip_code)
+    conditions = [~ssn_blank.to_numpy(), ~email_blank.to_numpy(), ~(name_blank & dob_blank & zip_blank).to_numpy()]
+
+    seed_ssn = "ssn:" + ssn_text
+    seed_email = "email:" + email_text.str.lower()
+    seed_name_dob_zip = "name_dob_zip:" + name_text.str.lower() + "|" + dob_text + "|" + zip_text
+    seed_application = "application:" + application_id.astype(str) + "|row:" + application_row_id.astype(str)
+    source_codes = np.select(conditions, [0, 1, 2], default=3).astype(np.int8)
+    seed_values = np.choose(
+        source_codes,
+        [
+            seed_ssn.to_numpy(dtype=object),
+            seed_email.to_numpy(dtype=object),
+            seed_name_dob_zip.to_numpy(dtype=object),
+            seed_application.to_numpy(dtype=object),
+        ],
+    )
+    seeds = pd.Series(seed_values, index=df.index, dtype=object)
+    sources = pd.Categorical.from_codes(source_codes, categories=_PSEUDO_ID_SOURCES)
+
+    pseudo_ids = _stable_hashes(seeds, salt=salt)
+    return pd.Series(pseudo_ids, index=df.index, dtype=object), pd.Series(sources, index=df.index)
+
+
+# Left-closed bands [0, 25), [25, 35), ..., [65, inf); negative or unknown ages get no band.
+_AGE_BAND_EDGES = np.array([25, 35, 45, 55, 65])
+_AGE_BAND_LABELS = np.array(["<25", "25-34", "35-44", "45-54", "55-64", "65+"], dtype=object)
 
 
 def _build_age_band(clean_dob: pd.Series) -> pd.Series:
     """Convert cleaned DOB values into coarse age bands for privacy-preserving analysis."""
-    dob = pd.to_datetime(clean_dob, errors="coerce")
-    reference = pd.Timestamp(config.ANALYSIS_REFERENCE_DATE)
-    age_years = (reference - dob).dt.days / 365.25
-    bins = [0, 25, 35, 45, 55, 65, np.inf]
-    labels = ["<25", "25-34", "35-44", "45-54", "55-64", "65+"]
-    return pd.cut(age_years, bins=bins, labels=labels, right=False).astype("string")
+    dob = pd.to_datetime(clean_dob, format="%Y-%m-%d", errors="coerce", cache=True)
+    dob_ns = dob.to_numpy(dtype="datetime64[ns]").view("i8")
+    reference_ns = np.int64(pd.Timestamp(config.ANALYSIS_REFERENCE_DATE).value)
+    age_days = (reference_ns - dob_ns) // 86_400_000_000_000
+    age_years = np.where(dob.isna().to_numpy(), np.nan, age_days / 365.25)
+    bands = _AGE_BAND_LABELS[np.searchsorted(_AGE_BAND_EDGES, age_years, side="right")]
+    bands[np.isnan(age_years) | (age_years < 0)] = None
+    return pd.Series(bands, index=clean_dob.index, dtype="string")
+
+
+# Keep the analysis output narrow so audit or remediation fields do not leak
+# into downstream modelling logic or inflate the analytical surface area.
+_ANALYSIS_COLUMNS = [
+    "application_id",
+    "applicant_pseudo_id",
+    "pseudo_id_source",
+    "pseudo_id_fallback_used_flag",
+    "age_band",
+    "age_band_missing_flag",
+    "clean_gender",
+    "clean_zip_code",
+    "clean_annual_income",
+    "clean_credit_history_months",
+    "clean_debt_to_income",
+    "clean_savings_balance",
+    "clean_loan_approved",
+    "clean_interest_rate",
+    "clean_approved_amount",
+    "clean_rejection_reason",
+]
+
+# Curated columns read while deriving the analysis dataset (pseudonym seeds, age band, outputs).
+_ANALYSIS_INPUT_COLUMNS = list(dict.fromkeys([
+    "application_id",
+    "application_row_id",
+    "raw_applicant_ssn",
+    "raw_applicant_email",
+    "raw_applicant_full_name",
+    "raw_applicant_date_of_birth",
+    "raw_applicant_zip_code",
+    "clean_date_of_birth",
+    *_ANALYSIS_COLUMNS,
+]))
 
 
 def build_analysis_dataset(curated_full_df: pd.DataFrame) -> pd.DataFrame:
     """Create a one-row-per-canonical-application PII-safe analysis dataset."""
-    analysis = curated_full_df.loc[curated_full_df["is_canonical_for_analysis"]].copy()
-    analysis = analysis.sort_values(["application_id", "application_row_id"]).reset_index(drop=True)
+    input_columns = [column for column in _ANALYSIS_INPUT_COLUMNS if column in curated_full_df.columns]
+    analysis = curated_full_df.loc[curated_full_df["is_canonical_for_analysis"], input_columns]
+    analysis = analysis.sort_values(["application_id", "application_row_id"])
+    analysis = analysis.loc[~analysis["application_id"].duplicated()].reset_index(drop=True)
 
     pseudo_id, pseudo_source = assign_applicant_pseudo_id(analysis)
     analysis["applicant_pseudo_id"] = pseudo_id
     analysis["pseudo_id_source"] = pseudo_source
-    analysis["pseudo_id_fallback_used_flag"] = ~analysis["pseudo_id_source"].eq("ssn")
+    analysis["pseudo_id_fallback_used_flag"] = analysis["pseudo_id_source"].ne("ssn")
 
     analysis["age_band"] = _build_age_band(analysis["clean_date_of_birth"])
     analysis["age_band_missing_flag"] = analysis["age_band"].isna()
 
     analysis = analysis.drop(columns=[column for column in config.DIRECT_PII_COLUMNS if column in analysis.columns])
-
-    # Keep the analysis output narrow so audit or remediation fields do not leak
-    # into downstream modelling logic or inflate the analytical surface area.
-    analysis_columns = [
-        "application_id",
-        "applicant_pseudo_id",
-        "pseudo_id_source",
-        "pseudo_id_fallback_used_flag",
-        "age_band",
-        "age_band_missing_flag",
-        "clean_gender",
-        "clean_zip_code",
-        "clean_annual_income",
-        "clean_credit_history_months",
-        "clean_debt_to_income",
-        "clean_savings_balance",
-        "clean_loan_approved",
-        "clean_interest_rate",
-        "clean_approved_amount",
-        "clean_rejection_reason",
-    ]
-    analysis = analysis[[column for column in analysis_columns if column in analysis.columns]].copy()
-    analysis = analysis.drop_duplicates(subset=["application_id"], keep="first")
-    return analysis.reset_index(drop=True)
+    return analysis[[column for column in _ANALYSIS_COLUMNS if column in analysis.columns]].copy()
 
 
 def generate_pii_inventory(*, curated_full_df: pd.DataFrame, analysis_df: pd.DataFrame) -> pd.DataFrame:
     """Build a minimal PII inventory for raw, curated, and analysis datasets."""
     curated_columns = set(curated_full_df.columns)
     analysis_columns = set(analysis_df.columns)
-    rows = [
-        {"field_path": "application_id", "classification": "Quasi-PII", "present_in_raw": True, "present_in_curated": "application_id" in curated_columns, "present_in_analysis": "application_id" in analysis_columns},
-        {"field_path": "applicant_info.full_name", "classification": "PII", "present_in_raw": True, "present_in_curated": "raw_applicant_full_name" in curated_columns, "present_in_analysis": False},
-        {"field_path": "applicant_info.email", "classification": "PII", "present_in_raw": True, "present_in_curated": "raw_applicant_email" in curated_columns, "present_in_analysis": False},
-        {"field_path": "applicant_info.ssn", "classification": "PII", "present_in_raw": True, "present_in_curated": "raw_applicant_ssn" in curated_columns, "present_in_analysis": False},
-        {"field_path": "applicant_info.ip_address", "classification": "PII", "present_in_raw": True, "present_in_curated": "raw_applicant_ip_address" in curated_columns, "present_in_analysis": False},
-        {"field_path": "applicant_info.date_of_birth", "classification": "PII", "present_in_raw": True, "present_in_curated": "raw_applicant_date_of_birth" in curated_columns, "present_in_analysis": False},
-        {"field_path": "applicant_info.gender", "classification": "Quasi-PII", "present_in_raw": True, "present_in_curated": "clean_gender" in curated_columns, "present_in_analysis": "clean_gender" in analysis_columns},
-        {"field_path": "applicant_info.zip_code", "classification": "Quasi-PII", "present_in_raw": True, "present_in_curated": "clean_zip_code" in curated_columns, "present_in_analysis": "clean_zip_code" in analysis_columns},
-        {"field_path": "applicant_pseudo_id", "classification": "Quasi-PII", "present_in_raw": False, "present_in_curated": False, "present_in_analysis": "applicant_pseudo_id" in analysis_columns},
-        {"field_path": "age_band", "classification": "Non-PII", "present_in_raw": False, "present_in_curated": False, "present_in_analysis": "age_band" in analysis_columns},
+    # (field_path, classification, present_in_raw, curated column, analysis column); None means never present.
+    fields = [
+        ("application_id", "Quasi-PII", True, "application_id", "application_id"),
+        ("applicant_info.full_name", "PII", True, "raw_applicant_full_name", None),
+        ("applicant_info.email", "PII", True, "raw_applicant_email", None),
+        ("applicant_info.ssn", "PII", True, "raw_applicant_ssn", None),
+        ("applicant_info.ip_address", "PII", True, "raw_applicant_ip_address", None),
+        ("applicant_info.date_of_birth", "PII", True, "raw_applicant_date_of_birth", None),
+        ("applicant_info.gender", "Quasi-PII", True, "clean_gender", "clean_gender"),
+        ("applicant_info.zip_code", "Quasi-PII", True, "clean_zip_code", "clean_zip_code"),
+        ("applicant_pseudo_id", "Quasi-PII", False, None, "applicant_pseudo_id"),
+        ("age_band", "Non-PII", False, None, "age_band"),
     ]
-    return pd.DataFrame(rows).sort_values("field_path").reset_index(drop=True)
+    columns: dict[str, list[Any]] = {
+        "field_path": [],
+        "classification": [],
+        "present_in_raw": [],
+        "present_in_curated": [],
+        "present_in_analysis": [],
+    }
+    for field_path, classification, present_in_raw, curated_column, analysis_column in fields:
+        columns["field_path"].append(field_path)
+        columns["classification"].append(classification)
+        columns["present_in_raw"].append(present_in_raw)
+        columns["present_in_curated"].append(curated_column in curated_columns)
+        columns["present_in_analysis"].append(analysis_column in analysis_columns)
+    return pd.DataFrame(columns).sort_values("field_path", kind="stable", ignore_index=True)
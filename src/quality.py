@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from . import schema
@@ -10,38 +11,32 @@ from . import schema
 SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 
 
-def _values_equal(left: Any, right: Any) -> bool:
-    """Compare scalar values with NA-aware equality semantics."""
-    if pd.isna(left) and pd.isna(right):
-        return True
-    return left == right
-
-
-def _rows_identical(group: pd.DataFrame, columns: list[str]) -> bool:
-    """Return True when all rows in the group match across the selected columns."""
-    if len(group) <= 1:
-        return True
-    baseline = group.iloc[0]
-    for _, row in group.iloc[1:].iterrows():
-        for column in columns:
-            if not _values_equal(baseline[column], row[column]):
-                return False
-    return True
-
-
-def _example_diff_columns(group: pd.DataFrame, canonical_row_id: int, compare_cols: list[str], max_cols: int = 5) -> str:
-    """Return a compact pipe-delimited list of columns that differ from the canonical row."""
-    canonical = group.loc[group["application_row_id"] == canonical_row_id]
-    if canonical.empty:
-        return ""
-    canonical_row = canonical.iloc[0]
-    for _, row in group.iterrows():
-        if int(row["application_row_id"]) == canonical_row_id:
-            continue
-        diff_cols = [column for column in compare_cols if not _values_equal(row[column], canonical_row[column])]
-        if diff_cols:
-            return "|".join(diff_cols[:max_cols])
-    return ""
+def _identical_groups(grouped: pd.api.typing.DataFrameGroupBy, columns: list[str]) -> pd.Series:
+    """Return one flag per group: True when every row matches across the selected columns (NA equals NA)."""
+    try:
+        return grouped[columns].nunique(dropna=False).le(1).all(axis=1)
+    except TypeError: #Unhashable values (dicts/lists in raw_* columns) cannot be counted, so compare each row with its group's first row instead
+        codes = grouped.ngroup().to_numpy()
+        values = grouped.obj[columns].to_numpy(dtype=object)
+        first = values[np.unique(codes, return_index=True)[1]][codes]
+        matches = ((values == first) | (pd.isna(values) & pd.isna(first))).all(axis=1)
+        return pd.Series(matches).groupby(codes).all().set_axis(grouped.size().index)
+
+
+def _example_diff_columns(values: np.ndarray, canonical_values: np.ndarray, is_canonical: np.ndarray, group_starts: np.ndarray, compare_cols: list[str], max_cols: int = 5) -> list[str]:
+    """Per group of contiguous rows, list the columns where the first differing non-canonical row departs from the canonical row."""
+    differs = ~((values == canonical_values) | (pd.isna(values) & pd.isna(canonical_values)))
+    differs[is_canonical] = False
+    diff_rows = np.flatnonzero(differs.any(axis=1))
+    next_diff = np.searchsorted(diff_rows, group_starts[:-1])
+    columns = np.asarray(compare_cols, dtype=object)
+    examples = []
+    for position, end in zip(next_diff, group_starts[1:]):
+        if position < len(diff_rows) and diff_rows[position] < end:
+            examples.append("|".join(columns[differs[diff_rows[position]]][:max_cols]))
+        else:
+            examples.append("")
+    return examples
 
 
 def analyze_duplicate_ids(applications_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -52,92 +47,103 @@ def analyze_duplicate_ids(applications_df: pd.DataFrame) -> tuple[pd.DataFrame,
     compare_cols_all = [column for column in df.columns if column not in {"application_row_id", "parsed_processing_timestamp"}]
     compare_cols_versioned = [column for column in compare_cols_all if column not in {"raw_processing_timestamp", "raw_notes"}]
 
-    duplicate_rows: list[dict[str, Any]] = []
-    metadata_rows: list[dict[str, Any]] = []
-
-    for application_id, group in df.groupby("application_id", dropna=False, sort=True):
-        group_sorted = group.sort_values("application_row_id").copy()
-        dup_count = len(group_sorted)
-        is_duplicate = dup_count > 1
-
-        parsed = group_sorted["parsed_processing_timestamp"]
-        if parsed.notna().any():
-            latest_ts = parsed.max()
-            candidates = group_sorted.loc[parsed == latest_ts]
-            if len(candidates) == 1:
-                canonical_row_id = int(candidates["application_row_id"].iloc[0])
-                canonical_reason = "latest_processing_timestamp"
-            else:
-                canonical_row_id = int(candidates["application_row_id"].max())
-                canonical_reason = "timestamp_tie_fallback_max_row_id"
-        else:
-            canonical_row_id = int(group_sorted["application_row_id"].max())
-            canonical_reason = "missing_or_unparseable_timestamp_fallback_max_row_id"
-
-        if not is_duplicate:
-            classification = "unique"
-        elif _rows_identical(group_sorted, compare_cols_all):
-            classification = "exact"
-        elif _rows_identical(group_sorted, compare_cols_versioned):
-            classification = "versioned"
-        elif parsed.notna().any():
-            classification = "versioned"
-        else:
-            classification = "conflict"
-
-        if is_duplicate:
-            duplicate_rows.append(
-                {
-                    "application_id": application_id,
-                    "dup_count": dup_count,
-                    "classification": classification,
-                    "canonical_row_id": canonical_row_id,
-                    "canonical_reason": canonical_reason,
-                    "example_differences": _example_diff_columns(group_sorted, canonical_row_id, compare_cols_all),
-                }
-            )
-
-        for _, row in group_sorted.iterrows():
-            metadata_rows.append(
-                {
-                    "application_row_id": int(row["application_row_id"]),
-                    "application_id": application_id,
-                    "is_duplicate_id": bool(is_duplicate),
-                    "is_canonical_for_analysis": bool(int(row["application_row_id"]) == canonical_row_id),
-                    "has_conflict": bool(classification == "conflict"),
-                }
-            )
+    grouped = df.groupby("application_id", dropna=False, sort=True)
+    group_codes = grouped.ngroup().to_numpy()
+    group_sizes = grouped.size()
+    application_ids = group_sizes.index
+    dup_count = group_sizes.to_numpy()
+    is_duplicate = dup_count > 1
+
+    row_ids = df["application_row_id"]
+    parsed = df["parsed_processing_timestamp"]
+    is_candidate = parsed.eq(grouped["parsed_processing_timestamp"].transform("max"))
+    candidate_count = is_candidate.groupby(group_codes).sum().to_numpy()
+    has_timestamp = candidate_count > 0
+    canonical_row_id = np.where(
+        has_timestamp,
+        row_ids.where(is_candidate).groupby(group_codes).max().to_numpy(),
+        row_ids.groupby(group_codes).max().to_numpy(),
+    ).astype("int64")
+    canonical_reason = np.select(
+        [~has_timestamp, candidate_count == 1],
+        ["missing_or_unparseable_timestamp_fallback_max_row_id", "latest_processing_timestamp"],
+        default="timestamp_tie_fallback_max_row_id",
+    )
+    classification = np.select(
+        [
+            ~is_duplicate,
+            _identical_groups(grouped, compare_cols_all).to_numpy(),
+            _identical_groups(grouped, compare_cols_versioned).to_numpy(),
+            has_timestamp,
+        ],
+        ["unique", "exact", "versioned", "versioned"],
+        default="conflict",
+    )
+
+    # Duplicate rows ordered by group, then row id, so each duplicate group is a contiguous block.
+    is_canonical = row_ids.to_numpy() == canonical_row_id[group_codes]
+    order = np.lexsort((row_ids.to_numpy(), group_codes))
+    order = order[is_duplicate[group_codes[order]]]
+    ordered_codes = group_codes[order]
+    values = df[compare_cols_all].iloc[order].to_numpy(dtype=object)
+    canonical_position = np.empty(len(dup_count), dtype=np.intp)
+    canonical_position[ordered_codes[is_canonical[order]]] = np.flatnonzero(is_canonical[order])
+    duplicate_codes = np.flatnonzero(is_duplicate)
+    group_starts = np.searchsorted(ordered_codes, np.append(duplicate_codes, len(dup_count)))
+    example_differences = _example_diff_columns(
+        values, values[canonical_position[ordered_codes]], is_canonical[order], group_starts, compare_cols_all
+    )
 
     duplicate_report = pd.DataFrame(
-        duplicate_rows,
-        columns=["application_id", "dup_count", "classification", "canonical_row_id", "canonical_reason", "example_differences"],
+        {
+            "application_id": application_ids[is_duplicate].infer_objects(),
+            "dup_count": dup_count[is_duplicate],
+            "classification": classification[is_duplicate].astype(object),
+            "canonical_row_id": canonical_row_id[is_duplicate],
+            "canonical_reason": canonical_reason[is_duplicate].astype(object),
+            "example_differences": pd.Series(example_differences, dtype=object),
+        },
     ).sort_values("application_id").reset_index(drop=True)
 
     metadata = pd.DataFrame(
-        metadata_rows,
-        columns=["application_row_id", "application_id", "is_duplicate_id", "is_canonical_for_analysis", "has_conflict"],
+        {
+            "application_row_id": row_ids.to_numpy().astype("int64"),
+            "application_id": application_ids.take(group_codes).infer_objects(),
+            "is_duplicate_id": is_duplicate[group_codes],
+            "is_canonical_for_analysis": is_canonical,
+            "has_conflict": classification[group_codes] == "conflict",
+        },
     ).sort_values("application_row_id").reset_index(drop=True)
     return duplicate_report, metadata
 
 
-def _example_ids(application_ids: pd.Series, mask: pd.Series, max_examples: int = 5) -> str:
+def _sorted_ids(application_ids: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Return positions of non-null application IDs in string sort order, with their string values."""
+    positions = np.flatnonzero(application_ids.notna().to_numpy())
+    text = application_ids.iloc[positions].astype(str).to_numpy()
+    order = np.argsort(text, kind="stable")
+    return positions[order], text[order]
+
+
+def _example_ids(sorted_ids: tuple[np.ndarray, np.ndarray], mask: pd.Series | np.ndarray, max_examples: int = 5) -> str:
     """Return a compact pipe-delimited set of example application IDs for a flagged mask."""
-    return "|".join(
-        application_ids[mask].dropna().astype(str).drop_duplicates().sort_values().head(max_examples).tolist()
-    )
+    positions, text = sorted_ids
+    return "|".join(pd.unique(text[np.asarray(mask, dtype=bool)[positions]])[:max_examples])
 
 
-def _rule_rows(data_df: pd.DataFrame, flags: pd.DataFrame, rules: dict[str, schema.RuleDef], stage: str) -> list[dict[str, Any]]:
+def _rule_rows(data_df: pd.DataFrame, flags: pd.DataFrame, rules: dict[str, schema.RuleDef], stage: str, sorted_ids: tuple[np.ndarray, np.ndarray]) -> list[dict[str, Any]]:
     """Convert rule flags into compact issue report rows."""
     rows: list[dict[str, Any]] = []
     denominator = len(data_df.index)
-    for flag_column, rule in rules.items():
-        if flag_column not in flags.columns:
-            continue
-        mask = flags[flag_column].fillna(False).astype(bool)
-        count = int(mask.sum())
+    flag_columns = [flag_column for flag_column in rules if flag_column in flags.columns]
+    flag_matrix = flags[flag_columns].fillna(False).to_numpy(dtype=bool)
+    counts = flag_matrix.sum(axis=0)
+    for position, flag_column in enumerate(flag_columns):
+        rule = rules[flag_column]
+        count = int(counts[position])
         if count == 0:
             continue
+        mask = flag_matrix[:, position]
         rows.append(
             {
                 "stage": stage,
@@ -148,13 +154,13 @@ def _rule_rows(data_df: pd.DataFrame, flags: pd.DataFrame, rules: dict[str, sche
                 "count": count,
                 "percent": round((count / denominator) * 100 if denominator else 0.0, 2),
                 "severity": rule.severity,
-                "example_application_ids": _example_ids(data_df["application_id"], mask),
+                "example_application_ids": _example_ids(sorted_ids, mask),
             }
         )
     return rows
 
 
-def _duplicate_rows(applications_df: pd.DataFrame, duplicate_report: pd.DataFrame, duplicate_metadata: pd.DataFrame, stage: str, ssn_column: str) -> list[dict[str, Any]]:
+def _duplicate_rows(applications_df: pd.DataFrame, duplicate_report: pd.DataFrame, duplicate_metadata: pd.DataFrame, stage: str, ssn_column: str, application_ids: tuple[np.ndarray, np.ndarray]) -> list[dict[str, Any]]:
     """Build duplicate and repeated-SSN issue rows for the quality report."""
     rows: list[dict[str, Any]] = []
     denominator = len(applications_df.index)
@@ -179,22 +185,24 @@ def _duplicate_rows(applications_df: pd.DataFrame, duplicate_report: pd.DataFram
             }
         )
 
-    append("R_DUP_001", int(dup_mask.sum()), (float(dup_mask.sum()) / denominator) * 100 if denominator else 0.0, _example_ids(duplicate_metadata["application_id"], dup_mask))
+    append("R_DUP_001", int(dup_mask.sum()), (float(dup_mask.sum()) / denominator) * 100 if denominator else 0.0, _example_ids(_sorted_ids(duplicate_metadata["application_id"]), dup_mask))
     append("R_DUP_002", int(len(duplicate_report.index)), (float(len(duplicate_report.index)) / denominator) * 100 if denominator else 0.0, "|".join(duplicate_report["application_id"].astype(str).sort_values().head(5).tolist()))
 
     if ssn_column in applications_df.columns:
         ssn = applications_df[ssn_column].fillna("").astype(str).str.strip()
-        non_blank = ssn.ne("")
-        ssn_counts = ssn[non_blank].value_counts()
-        duplicated_ssn_values = ssn_counts[ssn_counts > 1].index
-        dup_ssn_mask = ssn.isin(duplicated_ssn_values)
-        append("R_DUP_003", int(dup_ssn_mask.sum()), (float(dup_ssn_mask.sum()) / denominator) * 100 if denominator else 0.0, _example_ids(applications_df["application_id"], dup_ssn_mask))
-
-        ssn_to_app = applications_df.loc[dup_ssn_mask, [ssn_column, "application_id"]].dropna(subset=[ssn_column]).assign(**{ssn_column: lambda frame: frame[ssn_column].astype(str).str.strip()})
-        cross_app = ssn_to_app.groupby(ssn_column)["application_id"].nunique()
-        cross_app_values = set(cross_app[cross_app > 1].index.tolist())
-        cross_app_mask = ssn.isin(cross_app_values)
-        append("R_DUP_004", int(len(cross_app_values)), (float(len(cross_app_values)) / denominator) * 100 if denominator else 0.0, _example_ids(applications_df["application_id"], cross_app_mask))
+        ssn_codes, ssn_values = pd.factorize(ssn.mask(ssn.eq("")))
+        # Per-SSN flags get a trailing False so that blank rows (code -1) index into it as not flagged.
+        duplicated_ssn = np.append(np.bincount(ssn_codes[ssn_codes >= 0], minlength=len(ssn_values)) > 1, False)
+        dup_ssn_mask = duplicated_ssn[ssn_codes]
+        append("R_DUP_003", int(dup_ssn_mask.sum()), (float(dup_ssn_mask.sum()) / denominator) * 100 if denominator else 0.0, _example_ids(application_ids, dup_ssn_mask))
+
+        app_codes, app_values = pd.factorize(applications_df["application_id"])
+        linked = dup_ssn_mask & (app_codes >= 0)
+        pair_base = max(len(app_values), 1)
+        ssn_app_pairs = np.unique(ssn_codes[linked].astype(np.int64) * pair_base + app_codes[linked])
+        cross_app_ssn = np.append(np.bincount(ssn_app_pairs // pair_base, minlength=len(ssn_values)) > 1, False)
+        cross_app_mask = cross_app_ssn[ssn_codes]
+        append("R_DUP_004", int(cross_app_ssn.sum()), (float(cross_app_ssn.sum()) / denominator) * 100 if denominator else 0.0, _example_ids(application_ids, cross_app_mask))
 
     return rows
 
@@ -202,9 +210,10 @@ def _duplicate_rows(applications_df: pd.DataFrame, duplicate_report: pd.DataFram
 def build_data_quality_report(*, applications_df: pd.DataFrame, application_flags: pd.DataFrame, duplicate_report: pd.DataFrame, duplicate_metadata: pd.DataFrame, spending_df: pd.DataFrame, spending_flags: pd.DataFrame, stage: str, rule_catalog: pd.DataFrame | None = None, ssn_column: str = "raw_applicant_ssn") -> pd.DataFrame:
     """Build a concise issue registry for one pipeline stage."""
     rows = []
-    rows.extend(_rule_rows(applications_df, application_flags, schema.APPLICATION_RULES, stage))
-    rows.extend(_duplicate_rows(applications_df, duplicate_report, duplicate_metadata, stage, ssn_column))
-    rows.extend(_rule_rows(spending_df, spending_flags, schema.SPENDING_RULES, stage))
+    application_ids = _sorted_ids(applications_df["application_id"])
+    rows.extend(_rule_rows(applications_df, application_flags, schema.APPLICATION_RULES, stage, application_ids))
+    rows.extend(_duplicate_rows(applications_df, duplicate_report, duplicate_metadata, stage, ssn_column, application_ids))
+    rows.extend(_rule_rows(spending_df, spending_flags, schema.SPENDING_RULES, stage, _sorted_ids(spending_df["application_id"])))
 
     report = pd.DataFrame(rows, columns=["stage", "issue_group", "rule_id", "field_path", "description", "count", "percent", "severity", "example_application_ids"])
     if report.empty:
@@ -218,13 +227,13 @@ def build_data_quality_report(*, applications_df: pd.DataFrame, application_flag
     return report.drop(columns="severity_order").reset_index(drop=True)
 
 
-def _lookup_metric(report: pd.DataFrame, stage: str, rule_id: str) -> tuple[int, float, str]:
-    """Return count, percent, and issue group for a rule from a staged quality report."""
-    row = report.loc[(report["stage"] == stage) & (report["rule_id"] == rule_id)]
-    if row.empty:
-        return 0, 0.0, ""
-    first = row.iloc[0]
-    return int(first["count"]), float(first["percent"]), str(first["issue_group"])
+def _metric_lookup(report: pd.DataFrame) -> dict[tuple[Any, Any], tuple[int, float, str]]:
+    """Map (stage, rule_id) to count, percent, and issue group, keeping the first report row per rule."""
+    first = report.drop_duplicates(subset=["stage", "rule_id"])
+    return {
+        (stage, rule_id): (int(count), float(percent), str(issue_group))
+        for stage, rule_id, count, percent, issue_group in zip(first["stage"], first["rule_id"], first["count"], first["percent"], first["issue_group"])
+    }
 
 
 def build_before_after_comparison(*, quality_report: pd.DataFrame, duplicate_report: pd.DataFrame, duplicate_metadata: pd.DataFrame, total_records: int, canonical_count: int) -> pd.DataFrame:
@@ -247,9 +256,10 @@ def build_before_after_comparison(*, quality_report: pd.DataFrame, duplicate_rep
     ]
 
     rows: list[dict[str, Any]] = []
+    metric_lookup = _metric_lookup(quality_report)
     for rule_id, metric_label in metrics:
-        pre_count, pre_percent, issue_group = _lookup_metric(quality_report, "pre", rule_id)
-        post_count, post_percent, issue_group_post = _lookup_metric(quality_report, "post", rule_id)
+        pre_count, pre_percent, issue_group = metric_lookup.get(("pre", rule_id), (0, 0.0, ""))
+        post_count, post_percent, issue_group_post = metric_lookup.get(("post", rule_id), (0, 0.0, ""))
         rows.append(
             {
                 "issue_group": issue_group or issue_group_post,
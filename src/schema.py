@@ -4,9 +4,11 @@ import ipaddress
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from . import config
+from .clean import _BOOL_KEYS, _BOOL_VALUES, _STRING_DTYPE
 
 
 @dataclass(frozen=True)
@@ -81,28 +83,25 @@ def _blank_mask(series: pd.Series) -> pd.Series:
 
 def _to_bool(series: pd.Series) -> pd.Series:
     """Coerce a Series of mixed values into a nullable boolean-like object Series."""
-    mapping = {"true": True, "false": False, "1": True, "0": False, "yes": True, "no": False, "y": True, "n": False}
-    values: list[Any] = []
-    for value in series:
-        if isinstance(value, bool):
-            values.append(value)
-        elif pd.isna(value):
-            values.append(pd.NA)
-        else:
-            values.append(mapping.get(str(value).strip().lower(), pd.NA))
-    return pd.Series(values, index=series.index, dtype="object")
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype("object")
+    codes = series.astype(_STRING_DTYPE).str.strip().str.lower().astype(_BOOL_KEYS).cat.codes.to_numpy()
+    return pd.Series(pd.arrays.BooleanArray(_BOOL_VALUES[codes], codes < 0), index=series.index).astype("object")
+
+
+def _invalid_email(series: pd.Series) -> pd.Series:
+    """Return True for non-blank email strings that do not match the expected format."""
+    text = series.astype(_STRING_DTYPE).str.strip().fillna("")
+    return (text.ne("") & ~text.str.match(config.EMAIL_REGEX)).astype(bool)
 
 
 def _dob_ambiguous(series: pd.Series) -> pd.Series:
     """Return True for ambiguous NN/NN/YYYY DOB strings."""
     text = series.fillna("").astype(str).str.strip()
-    pattern = text.str.match(r"^\d{2}/\d{2}/\d{4}$")
-    parts = text.str.split("/", expand=True)
-    if parts.shape[1] != 3:
-        return pd.Series(False, index=series.index)
+    parts = text.str.extract(r"^(\d{2})/(\d{2})/(\d{4})$")
     left = pd.to_numeric(parts[0], errors="coerce")
     right = pd.to_numeric(parts[1], errors="coerce")
-    return pattern & left.le(12) & right.le(12)
+    return left.le(12) & right.le(12)
 
 
 def _dob_non_iso(series: pd.Series) -> pd.Series:
@@ -111,19 +110,23 @@ def _dob_non_iso(series: pd.Series) -> pd.Series:
     return text.ne("") & ~text.str.match(r"^\d{4}-\d{2}-\d{2}$")
 
 
+def _is_private_address(value: str) -> bool:
+    """Return True if a stripped, non-blank string parses as a private IP address."""
+    try:
+        return ipaddress.ip_address(value).is_private
+    except ValueError:
+        return False
+
+
 def _private_ip(series: pd.Series) -> pd.Series:
     """Return True for IP addresses that fall into private ranges."""
-    def is_private(value: Any) -> bool:
-        if pd.isna(value):
-            return False
-        value_str = str(value).strip()
-        if value_str == "":
-            return False
-        try:
-            return ipaddress.ip_address(value_str).is_private
-        except ValueError:
-            return False
-    return series.apply(is_private)
+    text = series.astype(_STRING_DTYPE).str.strip()
+    present = text.fillna("").ne("").to_numpy(dtype=bool)
+    candidates = text[present]
+    private_by_value = {value: _is_private_address(value) for value in candidates.unique()}
+    flags = np.zeros(len(series), dtype=bool)
+    flags[present] = candidates.map(private_by_value).to_numpy(dtype=bool)
+    return pd.Series(flags, index=series.index)
 
 
 def _non_numeric_string(series: pd.Series) -> pd.Series:
@@ -135,44 +138,26 @@ def _non_numeric_string(series: pd.Series) -> pd.Series:
 
 def build_rule_catalog() -> pd.DataFrame:
     """Build the minimal stage-aware rule catalog used to interpret reports."""
-    rows: list[dict[str, Any]] = []
+    columns: dict[str, list[Any]] = {column: [] for column in RULE_CATALOG_COLUMNS}
+    flag_rules = (*APPLICATION_RULES.values(), *SPENDING_RULES.values())
     for stage in ("pre", "post"):
-        for rule in APPLICATION_RULES.values():
-            rows.append({
-                "stage": stage,
-                "rule_id": rule.rule_id,
-                "issue_group": rule.issue_group,
-                "field_path": rule.field_path,
-                "field_path_annotated": rule.field_path_annotated_pre if stage == "pre" else rule.field_path_annotated_post,
-                "value_source": rule.value_source_pre if stage == "pre" else rule.value_source_post,
-                "severity": rule.severity,
-                "description": rule.description,
-            })
-        for rule in SPENDING_RULES.values():
-            rows.append({
-                "stage": stage,
-                "rule_id": rule.rule_id,
-                "issue_group": rule.issue_group,
-                "field_path": rule.field_path,
-                "field_path_annotated": rule.field_path_annotated_pre if stage == "pre" else rule.field_path_annotated_post,
-                "value_source": rule.value_source_pre if stage == "pre" else rule.value_source_post,
-                "severity": rule.severity,
-                "description": rule.description,
-            })
+        for rule in flag_rules:
+            columns["stage"].append(stage)
+            columns["rule_id"].append(rule.rule_id)
+            columns["issue_group"].append(rule.issue_group)
+            columns["field_path"].append(rule.field_path)
+            columns["field_path_annotated"].append(rule.field_path_annotated_pre if stage == "pre" else rule.field_path_annotated_post)
+            columns["value_source"].append(rule.value_source_pre if stage == "pre" else rule.value_source_post)
+            columns["severity"].append(rule.severity)
+            columns["description"].append(rule.description)
         for item in DUPLICATE_RULES:
             if item["rule_id"] in {"R_DUP_CONFLICT", "R_DUP_CANONICAL"} and stage == "pre":
                 continue
-            rows.append({
-                "stage": stage,
-                "rule_id": item["rule_id"],
-                "issue_group": item["issue_group"],
-                "field_path": item["field_path"],
-                "field_path_annotated": pd.NA,
-                "value_source": item["value_source"],
-                "severity": item["severity"],
-                "description": item["description"],
-            })
-    return pd.DataFrame(rows, columns=RULE_CATALOG_COLUMNS).drop_duplicates().reset_index(drop=True)
+            columns["stage"].append(stage)
+            columns["field_path_annotated"].append(pd.NA)
+            for column in ("rule_id", "issue_group", "field_path", "value_source", "severity", "description"):
+                columns[column].append(item[column])
+    return pd.DataFrame(columns, columns=RULE_CATALOG_COLUMNS).drop_duplicates().reset_index(drop=True)
 
 
 def validate_applications_preclean(df: pd.DataFrame) -> pd.DataFrame:
@@ -182,9 +167,7 @@ def validate_applications_preclean(df: pd.DataFrame) -> pd.DataFrame:
     flags["flag_missing_required_applicant_field"] = pd.concat([_blank_mask(df[column]) for column in config.REQUIRED_APPLICANT_RAW_COLUMNS], axis=1).any(axis=1)
     flags["flag_missing_ssn_and_ip"] = _blank_mask(df["raw_applicant_ssn"]) & _blank_mask(df["raw_applicant_ip_address"])
     flags["flag_blank_email"] = _blank_mask(df["raw_applicant_email"])
-
-    email_text = df["raw_applicant_email"].fillna("").astype(str).str.strip()
-    flags["flag_invalid_email"] = email_text.ne("") & ~email_text.str.match(config.EMAIL_REGEX)
+    flags["flag_invalid_email"] = _invalid_email(df["raw_applicant_email"])
 
     gender_text = df["raw_applicant_gender"].fillna("").astype(str).str.strip().str.lower()
     flags["flag_gender_needs_normalisation"] = gender_text.isin({"m", "f"})
@@ -236,9 +219,7 @@ def validate_applications_postclean(df: pd.DataFrame) -> pd.DataFrame:
     ], axis=1).any(axis=1)
     flags["flag_missing_ssn_and_ip"] = _blank_mask(df["raw_applicant_ssn"]) & _blank_mask(df["raw_applicant_ip_address"])
     flags["flag_blank_email"] = _blank_mask(df["clean_email"])
-
-    clean_email = df["clean_email"].fillna("").astype(str).str.strip()
-    flags["flag_invalid_email"] = clean_email.ne("") & ~clean_email.str.match(config.EMAIL_REGEX)
+    flags["flag_invalid_email"] = _invalid_email(df["clean_email"])
 
     clean_gender = df["clean_gender"].fillna("").astype(str).str.strip()
     flags["flag_gender_needs_normalisation"] = clean_gender.ne("") & ~clean_gender.isin(["Male", "Female"])